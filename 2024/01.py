@@ -1,11 +1,29 @@
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
+from array import array
 from collections import Counter
+import heapq
+from itertools import islice
+import os
+import tempfile
 
+from common.inputs import Buffer, iter_chunks, map_input
+from common.ints import extract_ints, extract_numpy
 
-def parse_lists(s: str) -> Tuple[List[int], List[int]]:
-    raw_pairs = [t.split() for t in s.strip().splitlines()]
-    int_pairs = [[int(a), int(b)] for a, b in raw_pairs]
-    return zip(*int_pairs)
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional, it is only needed by the vectorized functions
+    np = None
+
+
+def parse_lists(s: Buffer) -> Tuple[List[int], List[int]]:
+    # Numbers are extracted one chunk of lines at a time, the input is never copied as a whole
+    l0, l1 = [], []
+    for chunk in iter_chunks(s):
+        ints = extract_ints(chunk)
+        l0 += ints[0::2]
+        l1 += ints[1::2]
+    return l0, l1
 
 
 def distance(l0: List[int], l1: List[int]) -> int:
@@ -19,6 +37,95 @@ def similarity(l0: List[int], l1: List[int]) -> int:
     return sum(a * l1_counts[a] for a in l0)
 
 
+def parse_arrays(s: Buffer):
+    # Both columns as int64 arrays, without creating a Python int per number
+    ints = extract_numpy(s)
+    return ints[0::2], ints[1::2]
+
+
+def distance_vectorized(a0, a1) -> int:
+    return int(np.abs(np.sort(a0) - np.sort(a1)).sum())
+
+
+def similarity_vectorized(a0, a1) -> int:
+    # Distinct values of both lists with their counts, the right counts are looked up
+    # with a binary search. Searching only distinct values keeps the lookups few and sorted.
+    v0, c0 = np.unique(a0, return_counts=True)
+    v1, c1 = np.unique(a1, return_counts=True)
+    if len(v1) == 0:
+        return 0
+    i = np.minimum(np.searchsorted(v1, v0), len(v1) - 1)
+    found = v1[i] == v0
+    return int((v0 * c0 * np.where(found, c1[i], 0)).sum())
+
+
+# External sort, for lists that don't fit in memory: sorted runs of each column are
+# spilled to temporary files as arrays of 8 byte ints, then merged back in a single
+# streaming pass.
+
+
+def write_run(directory: str, numbers: Iterable[int], size: int) -> str:
+    with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as f:
+        numbers = iter(numbers)
+        while chunk := array("q", islice(numbers, size)):
+            chunk.tofile(f)
+        return f.name
+
+
+def read_run(path: str, size: int) -> Iterator[int]:
+    with open(path, "rb") as f:
+        while True:
+            chunk = array("q")
+            try:
+                chunk.fromfile(f, size)
+            except EOFError:
+                # The last numbers are still read
+                yield from chunk
+                return
+            yield from chunk
+
+
+def spill_runs(s: Buffer, directory: str, memory: int) -> Tuple[List[str], List[str]]:
+    runs = ([], [])
+    for chunk in iter_chunks(s, memory):
+        ints = extract_ints(chunk)
+        for column, numbers in zip(runs, (ints[0::2], ints[1::2])):
+            column.append(write_run(directory, sorted(numbers), len(numbers)))
+    return runs
+
+
+def merge_runs(directory: str, runs: List[str], size: int, fan_in: int) -> Iterator[int]:
+    # Runs are merged fan_in at a time, until few enough are left to be merged in a single pass
+    while len(runs) > fan_in:
+        merged = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i:i + fan_in]
+            merged.append(write_run(directory, heapq.merge(*(read_run(r, size) for r in group)), size))
+            for r in group:
+                os.remove(r)
+        runs = merged
+    return heapq.merge(*(read_run(r, size) for r in runs))
+
+
+def distance_external(s: Buffer, memory=16 * 1024 * 1024, fan_in=16) -> int:
+    # Sorts about memory bytes of input at a time, and buffers as much while merging
+    size = max(1, memory // (8 * 2 * fan_in))
+    with tempfile.TemporaryDirectory() as directory:
+        runs0, runs1 = spill_runs(s, directory, memory)
+        pairs = zip(merge_runs(directory, runs0, size, fan_in), merge_runs(directory, runs1, size, fan_in))
+        return sum(abs(a - b) for a, b in pairs)
+
+
+def similarity_streaming(s: Buffer, memory=16 * 1024 * 1024) -> int:
+    # Only the counts of each distinct ID are kept, the order of the lists doesn't matter
+    l0_counts, l1_counts = Counter(), Counter()
+    for chunk in iter_chunks(s, memory):
+        ints = extract_ints(chunk)
+        l0_counts.update(ints[0::2])
+        l1_counts.update(ints[1::2])
+    return sum(a * n * l1_counts[a] for a, n in l0_counts.items())
+
+
 example_lists = """
 3   4
 4   3
@@ -34,12 +141,23 @@ def example():
     assert distance(l0, l1) == 11
     assert similarity(l0, l1) == 31
 
+    assert distance_external(example_lists) == 11
+    # One line per run, merged two runs at a time
+    assert distance_external(example_lists, memory=1, fan_in=2) == 11
+    assert similarity_streaming(example_lists) == 31
+    assert similarity_streaming(example_lists, memory=1) == 31
+
+    if np is not None:
+        a0, a1 = parse_arrays(example_lists)
+        assert distance_vectorized(a0, a1) == 11
+        assert similarity_vectorized(a0, a1) == 31
+
 
 if __name__ == "__main__":
     example()
 
-    with open("2024/01.input", "r") as f:
-        l0, l1 = parse_lists(f.read())
+    with map_input("2024/01.input") as f:
+        l0, l1 = parse_lists(f)
 
     print(distance(l0, l1))
     print(similarity(l0, l1))
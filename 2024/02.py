@@ -1,22 +1,88 @@
-from typing import List
+from typing import Dict, Iterator, List
 
+from common.inputs import Buffer, iter_lines, map_input
+from common.ints import extract_ints, extract_numpy
 
-def parse_reports(s: str) -> List[List[int]]:
-    return [[int(n) for n in l.split()] for l in s.strip().splitlines()]
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional, it is only needed by the batched functions
+    np = None
 
 
-def is_safe(r: List[int]) -> bool:
-    pairs = [(r[i], r[i + 1]) for i in range(len(r) - 1)]
-    offsets = [a - b for a, b in pairs]
+def iter_reports(s: Buffer) -> Iterator[List[int]]:
+    return (extract_ints(l) for l in iter_lines(s) if l)
+
+
+def parse_reports(s: Buffer) -> List[List[int]]:
+    return list(iter_reports(s))
+
 
-    return (
-        (all(o > 0 for o in offsets) or all(o < 0 for o in offsets))
-        and all(abs(o) <= 3 for o in offsets)
-    )
+def first_violation(r: List[int], direction: int, skip=-1) -> int:
+    # Index of the first level that isn't 1 to 3 steps away from the previous one in
+    # the given direction (1 increasing, -1 decreasing), ignoring the level at skip
+    previous = None
+    for i, level in enumerate(r):
+        if i == skip:
+            continue
+        if previous is not None and not 1 <= (level - previous) * direction <= 3:
+            return i
+        previous = level
+    return -1
+
+
+def is_safe(r: List[int]) -> bool:
+    return first_violation(r, 1) == -1 or first_violation(r, -1) == -1
 
 
 def is_safe_dampened(r: List[int]) -> bool:
-    return is_safe(r) or any(is_safe(r[:i] + r[i + 1:]) for i in range(len(r)))
+    # For a given direction, one of the two levels of the first unsafe step has to be removed,
+    # removing any other level leaves that step unsafe
+    for direction in (1, -1):
+        i = first_violation(r, direction)
+        if i == -1 or first_violation(r, direction, i - 1) == -1 or first_violation(r, direction, i) == -1:
+            return True
+    return False
+
+
+def group_reports(s: Buffer) -> Dict[int, "np.ndarray"]:
+    # Reports of the same length are stacked in a 2D array, one report per row.
+    # Levels are parsed in one go, the length of each report is found by counting
+    # the numbers that start on each line.
+    chars = np.frombuffer(s.encode() if isinstance(s, str) else s, dtype=np.uint8)
+    digits = (chars >= ord("0")) & (chars <= ord("9"))
+    starts = digits & ~np.concatenate(([False], digits[:-1]))
+    lengths = np.bincount(np.cumsum(chars == ord("\n"))[starts])
+    firsts = np.cumsum(lengths) - lengths
+    levels = extract_numpy(s)
+
+    groups = {}
+    for length in np.unique(lengths[lengths > 0]):
+        rows = firsts[lengths == length]
+        groups[int(length)] = levels[rows[:, None] + np.arange(length)]
+    return groups
+
+
+def safe_rows(levels: "np.ndarray") -> "np.ndarray":
+    # Works on the last axis, so several variants of each report can be checked at once
+    offsets = np.diff(levels, axis=-1)
+    increasing = ((offsets >= 1) & (offsets <= 3)).all(axis=-1)
+    decreasing = ((offsets <= -1) & (offsets >= -3)).all(axis=-1)
+    return increasing | decreasing
+
+
+def count_safe_batched(s: Buffer, dampened=False) -> int:
+    count = 0
+    for length, levels in group_reports(s).items():
+        if dampened and length > 1:
+            # Row k of kept lists the indices of a report without its level k, so levels[:, kept]
+            # holds every report with each level removed: (reports, length, length - 1)
+            kept = np.array([[j for j in range(length) if j != k] for k in range(length)])
+            safe = safe_rows(levels[:, kept]).any(axis=-1) | safe_rows(levels)
+        else:
+            safe = safe_rows(levels)
+        count += int(safe.sum())
+    return count
 
 
 example_reports = """
@@ -34,11 +100,15 @@ def example():
     assert sum(is_safe(r) for r in reports) == 2
     assert sum(is_safe_dampened(r) for r in reports) == 4
 
+    if np is not None:
+        assert count_safe_batched(example_reports) == 2
+        assert count_safe_batched(example_reports, dampened=True) == 4
+
 
 if __name__ == "__main__":
     example()
 
-    with open("2024/02.input", "r") as f:
-        reports = parse_reports(f.read())
-    print(sum(is_safe(r) for r in reports))
-    print(sum(is_safe_dampened(r) for r in reports))
+    # Reports are checked as they are read, without keeping them all in memory
+    with map_input("2024/02.input") as f:
+        print(sum(is_safe(r) for r in iter_reports(f)))
+        print(sum(is_safe_dampened(r) for r in iter_reports(f)))
@@ -1,8 +1,18 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain, compress, repeat
+from operator import itemgetter
+import os
 import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from common.inputs import Buffer
 
 
 instruction = r"(mul)\((\d{1,3}),(\d{1,3})\)"
 instruction_v2 = instruction + r"|(do)\(\)|(don't)\(\)"
+# Length of the longest instruction, mul(123,456)
+longest = 12
 
 
 def read_memory(input: str):
@@ -21,6 +31,140 @@ def read_memory_v2(input: str):
             yield int(match.group(2)), int(match.group(3))
 
 
+def chunked(memory: str, size: int) -> Iterator[str]:
+    return (memory[i:i + size] for i in range(0, len(memory), size))
+
+
+def read_memory_stream(chunks: Iterable[str], conditional=True) -> Iterator[Tuple[int, int]]:
+    # Same as read_memory_v2 (or read_memory when not conditional), on a memory read chunk
+    # by chunk. Instructions can straddle two chunks, so the last characters of a chunk
+    # that could start one are kept, and scanned again with the next chunk.
+    do_yield = True
+    pending = ""
+    for chunk in chain(chunks, [None]):
+        if chunk is None:
+            # End of the memory, everything left can be matched
+            memory, stop = pending, len(pending)
+        else:
+            memory = pending + chunk
+            stop = len(memory) - (longest - 1)
+        end = 0
+        for match in re.finditer(instruction_v2, memory):
+            if match.start() >= stop:
+                break
+            end = match.end()
+            if match.group(4):
+                do_yield = True
+            elif match.group(5):
+                do_yield = False
+            elif do_yield or not conditional:
+                yield int(match.group(2)), int(match.group(3))
+        pending = memory[max(stop, end):]
+
+
+# read_memory_bytes sees every digit as a 0, "mul(a,b" then has only 9 possible shapes
+digits_to_zero = bytes.maketrans(b"0123456789", b"0" * 10)
+mul_shapes = tuple(b"mul(%s,%s" % (b"0" * i, b"0" * j) for i in range(3, 0, -1) for j in range(3, 0, -1))
+toggles = (b"do(", b"don't(")
+# Operands have 1 to 3 digits, looking them up is cheaper than int()
+operand_values = {b"%0*d" % (k, v): v for k in range(1, 4) for v in range(10 ** k)}
+
+
+def read_memory_bytes(memory: Buffer, conditional=True, size=1 << 20) -> Iterator[Tuple[int, int]]:
+    # Same as read_memory_v2 (or read_memory when not conditional), without regexes. Every
+    # instruction ends with the first ")" after its start, so the memory is split on ")", and
+    # instructions are the pieces ending with "do(", "don't(" or "mul(a,b". With the digits
+    # zeroed, that is a single endswith per piece, done by map() and compress() without a
+    # Python loop. Near misses such as "mul(12", "mul(1234,5)" or "do(" without a ")" cost
+    # next to nothing. Only ASCII digits are operands, unlike \d on a str.
+    # The memory is read in chunks of about size bytes that end after a ")", so no
+    # instruction is split and the input is never copied as a whole.
+    # It beats read_memory_v2, and read_memory on near-miss inputs, but only ties with
+    # read_memory on ordinary inputs: it is a variant for part 2, the regexes stay the default.
+    endings = mul_shapes + toggles if conditional else mul_shapes
+    do_yield = True
+    close = ")" if isinstance(memory, str) else b")"
+    start = 0
+    end = len(memory)
+    while start < end:
+        i = memory.find(close, start + size - 1) if start + size < end else -1
+        i = end if i == -1 else i + 1
+        chunk = memory[start:i]
+        start = i
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+
+        pieces = chunk.split(b")")
+        shapes = chunk.translate(digits_to_zero).split(b")")
+        # The last piece isn't followed by a ")"
+        del pieces[-1]
+        instructions = compress(pieces, map(bytes.endswith, shapes, repeat(endings)))
+
+        if conditional:
+            muls = []
+            for instruction in instructions:
+                if instruction.endswith(b"do("):
+                    do_yield = True
+                elif instruction.endswith(b"don't("):
+                    do_yield = False
+                elif do_yield:
+                    muls.append(instruction)
+        else:
+            muls = instructions
+
+        # All the "a,b" after the last "(" are converted at once, joined as "a,b,a,b,..."
+        operands = b",".join(map(itemgetter(2), map(bytes.rpartition, muls, repeat(b"("))))
+        if operands:
+            numbers = map(operand_values.__getitem__, operands.split(b","))
+            yield from zip(numbers, numbers)
+
+
+def scan_segment(segment: str, end: int, conditional=True) -> Tuple[int, int, Optional[bool]]:
+    # Sums of the products of a segment when it starts enabled and when it starts disabled,
+    # and its final state (None if it has no do() or don't()). Segments overlap the next one
+    # by (longest - 1) characters, only instructions starting before end belong to them.
+    if_enabled, if_disabled = 0, 0
+    state = None
+    for match in re.finditer(instruction_v2, segment):
+        if match.start() >= end:
+            break
+        if match.group(1):
+            product = int(match.group(2)) * int(match.group(3))
+            if state is None:
+                if_enabled += product
+            elif state:
+                if_enabled += product
+                if_disabled += product
+        elif conditional:
+            state = bool(match.group(4))
+    return if_enabled, if_disabled, state
+
+
+def read_memory_parallel(memory: str, workers: int = None, segments: int = None, conditional=True) -> int:
+    # Instructions never overlap, none of them contains an "m" or a "d" after its first
+    # character, so scanning from any offset finds the same instructions as a scan from
+    # the start. Any offset is a safe boundary, the memory is split in equal segments.
+    workers = workers or os.cpu_count()
+    segments = segments or workers
+    size = max(1, -(-len(memory) // segments))
+    parts: List[str] = [memory[i:i + size + longest - 1] for i in range(0, len(memory), size)]
+    scan = partial(scan_segment, conditional=conditional)
+
+    if workers == 1:
+        results = list(map(scan, parts, repeat(size)))
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(scan, parts, repeat(size)))
+
+    # Segments are stitched in order, each one starts in the final state of the previous one
+    total, enabled = 0, True
+    for if_enabled, if_disabled, state in results:
+        total += if_enabled if enabled else if_disabled
+        if state is not None:
+            enabled = state
+    return total
+
+
 example_memory0 = "xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))"
 example_memory1 = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
 
@@ -29,12 +173,23 @@ def example():
     assert sum(a * b for a, b in read_memory(example_memory0)) == 161
     assert sum(a * b for a, b in read_memory_v2(example_memory1)) == 48
 
+    for size in (1, 2, 5, longest - 1, longest, longest + 1):
+        assert sum(a * b for a, b in read_memory_stream(chunked(example_memory0, size), conditional=False)) == 161
+        assert sum(a * b for a, b in read_memory_stream(chunked(example_memory1, size))) == 48
+
+    for segments in (1, 2, 3, 5, 8, len(example_memory1)):
+        assert read_memory_parallel(example_memory0, workers=1, segments=segments, conditional=False) == 161
+        assert read_memory_parallel(example_memory1, workers=1, segments=segments) == 48
+
+    assert sum(a * b for a, b in read_memory_bytes(example_memory0, conditional=False)) == 161
+    assert sum(a * b for a, b in read_memory_bytes(example_memory1)) == 48
+
 
 if __name__ == "__main__":
     example()
 
+    # The memory is read 1 MB at a time, only one chunk is kept in memory
     with open("2024/03.input", "r") as f:
-        memory = f.read()
-
-    print(sum(a * b for a, b in read_memory(memory)))
-    print(sum(a * b for a, b in read_memory_v2(memory)))
\ No newline at end of file
+        print(sum(a * b for a, b in read_memory_stream(iter(partial(f.read, 1 << 20), ""), conditional=False)))
+        f.seek(0)
+        print(sum(a * b for a, b in read_memory_stream(iter(partial(f.read, 1 << 20), ""))))
@@ -1,50 +1,104 @@
-def parse_grid(grid: str) -> list[str]:
-    lines = grid.strip().splitlines()
+from typing import Dict, Iterable
+
+from common.grid import Grid
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional, it is only needed by the vectorized functions
+    np = None
+
+
+def count_overlapping(line: bytes, word: bytes) -> int:
+    # bytes.count skips overlapping occurrences, which only words like "ABAB" or "AA" can have
+    if not any(word[:k] == word[-k:] for k in range(1, len(word))):
+        return line.count(word)
+    count = 0
+    i = line.find(word)
+    while i != -1:
+        count += 1
+        i = line.find(word, i + 1)
+    return count
+
+
+def count_words(grid: Grid, words: Iterable[str]) -> Dict[str, int]:
+    # Occurrences of each word in all 8 directions, as the 4 directions of the lines of the
+    # grid, forward and backward. Stepping through the flat grid by the offset of a direction
+    # follows a line, and crosses a border cell when moving to the next line. Border cells
+    # never match, so the grid can be searched in a few slices with a step, each of them
+    # holding many lines, without building lines one by one.
+    words = {w: (w.encode(), w.encode()[::-1]) for w in words}
+    if any(not w for w in words):
+        raise ValueError("Can't search an empty word")
+    cells = grid.cells
+    counts = {w: 0 for w in words}
+
+    for step in (grid.right, grid.down, grid.down + grid.right, grid.down + grid.left):
+        # Rows are already separated by border cells in the flat grid
+        lines = [cells] if step == grid.right else (cells[r::step] for r in range(step))
+        for line in lines:
+            for w, (forward, backward) in words.items():
+                counts[w] += count_overlapping(line, forward) + count_overlapping(line, backward)
+
+    return counts
+
+
+def process_grid(grid: str, word="XMAS"):
+    return count_words(Grid.parse(grid), [word])[word]
+
+
+def find_crosses(s: str):
+    grid = Grid.parse(s)
+    cells = grid.cells
+    up_left, up_right, down_left, down_right = grid.diagonals
+    a, m, s_ = b"AMS"
+    ends = ((m, s_), (s_, m))
 
-    width = len(lines[0])
-    height = len(lines)
-
-    columns = ["" for _ in range(width)]
-    rows = ["" for _ in range(height)]
-    forward_diagonals = ["" for _ in range(height + width - 1)]
-    backward_diagonals = ["" for _ in range(len(forward_diagonals))]
-
-    min_backwards_diagonal = -height + 1
-
-    for x in range(width):
-        for y in range(height):
-            columns[x] += lines[y][x]
-            rows[y] += lines[y][x]
-            forward_diagonals[x + y] += lines[y][x]
-            backward_diagonals[x - y - min_backwards_diagonal] += lines[y][x]
-
-    return columns + rows + forward_diagonals + backward_diagonals
-
-
-def find_xmas(line: str):
-    return line.count("XMAS") + line[::-1].count("XMAS")
+    crosses = 0
 
+    # Centers on the edges have border cells as neighbors, which never match
+    for i in grid.indices():
+        if cells[i] != a:
+            continue
+        diagonal0 = (cells[i + up_left], cells[i + down_right])
+        diagonal1 = (cells[i + up_right], cells[i + down_left])
+        if diagonal0 in ends and diagonal1 in ends:
+            crosses += 1
 
-def process_grid(grid: str):
-    return sum(find_xmas(l) for l in parse_grid(grid))
+    return crosses
 
 
-def find_crosses(grid: str):
-    lines = grid.strip().splitlines()
+def count_crosses(grid: Grid, word="MAS") -> int:
+    # Cells where both diagonals read word (forwards or backwards) through its middle letter,
+    # checked for all cells at once: the cell at offset (dx, dy) of every cell is a shifted
+    # slice of the grid. Letters of word become small ints, any other letter (and the
+    # border) becomes 0, which never matches.
+    if len(word) % 2 == 0:
+        raise ValueError(f"Crosses need a word with a middle letter, not {word!r}")
+    r = len(word) // 2
+    codes = np.zeros(256, dtype=np.uint8)
+    for i, c in enumerate(sorted(set(word.encode())), 1):
+        codes[c] = i
+    word = codes[list(word.encode())]
 
-    width = len(lines[0])
-    height = len(lines)
+    # The border of the grid is widened to the radius of the cross, so no shift goes out of bounds
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height + 2, grid.stride)
+    letters = np.pad(codes[cells], r)
+    w, h = grid.width, grid.height
 
-    crosses = 0
+    def shifted(dx: int, dy: int):
+        return letters[1 + r + dy:1 + r + dy + h, 1 + r + dx:1 + r + dx + w]
 
-    for x in range(width - 2):
-        for y in range(height - 2):
-            diagonal0 = lines[y][x] + lines[y + 1][x + 1] + lines[y + 2][x + 2]
-            diagonal1 = lines[y][x + 2] + lines[y + 1][x + 1] + lines[y + 2][x]
-            if diagonal0 in ("SAM", "MAS") and diagonal1 in ("SAM", "MAS"):
-                crosses += 1
+    def reads(dx: int, dy: int, word):
+        # word along the diagonal (dx, dy), centered on each cell
+        matches = np.ones((h, w), dtype=bool)
+        for j, c in enumerate(word):
+            matches &= shifted(dx * (j - r), dy * (j - r)) == c
+        return matches
 
-    return crosses
+    diagonal0 = reads(1, 1, word) | reads(1, 1, word[::-1])
+    diagonal1 = reads(-1, 1, word) | reads(-1, 1, word[::-1])
+    return int((diagonal0 & diagonal1).sum())
 
 
 example_grid = """
@@ -63,8 +117,14 @@ MXMXAXMASX
 
 def example():
     assert process_grid(example_grid) == 18
+    assert count_words(Grid.parse(example_grid), ["XMAS", "SAM", "MM"]) == {"XMAS": 18, "SAM": 38, "MM": 78}
     assert find_crosses(example_grid) == 9
 
+    if np is not None:
+        assert count_crosses(Grid.parse(example_grid)) == 9
+        assert count_crosses(Grid.parse(example_grid), "XMASAMX") == 0
+        assert count_crosses(Grid.parse(example_grid), "M") == 38
+
 
 if __name__ == "__main__":
     example()
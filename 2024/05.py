@@ -1,30 +1,112 @@
-from typing import List, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from common.ints import extract_ints, records
 
 
 def parse_input(input: str) -> Tuple[List[Tuple[int, int]], List[List[int]]]:
     part0, part1 = input.strip().split("\n\n")
 
-    ordering_pairs = [tuple([int(n) for n in l.split("|")]) for l in part0.splitlines()]
-    page_numbers = [[int(n) for n in l.split(",")] for l in part1.splitlines()]
+    ordering_pairs = records(extract_ints(part0), 2)
+    page_numbers = [extract_ints(l) for l in part1.splitlines()]
 
     return ordering_pairs, page_numbers
 
 
-def is_correct_order(pns: List[List[int]], ordering_pairs: List[Tuple[int, int]], flip=False):
+# Pages that must come after each page
+Rules = Dict[int, Set[int]]
+
+no_pages = frozenset()
+
+
+def compile_rules(ordering_pairs: Iterable[Tuple[int, int]]) -> Rules:
+    rules: Rules = {}
     for a, b in ordering_pairs:
-        if a in pns and b in pns and pns.index(a) > pns.index(b):
-            if flip:
-                pns[pns.index(a)], pns[pns.index(b)] = pns[pns.index(b)], pns[pns.index(a)]
+        rules.setdefault(a, set()).add(b)
+    return rules
+
+
+def is_correct_order(pns: List[int], rules: Rules) -> bool:
+    # A single pass: no page can have a page that must come after it among the pages before it.
+    # Checking adjacent pairs only would be enough if rules ordered every pair of pages.
+    seen = set()
+    for p in pns:
+        if not rules.get(p, no_pages).isdisjoint(seen):
             return False
+        seen.add(p)
     return True
 
 
+class CycleError(ValueError):
+    pass
+
+
+def find_cycle(successors: Dict[int, Set[int]], remaining: Set[int]) -> List[int]:
+    # Pages left over by a topological sort all have a predecessor left over,
+    # walking back through predecessors eventually loops
+    predecessors = {b: a for a in remaining for b in successors[a] if b in remaining}
+    p = next(iter(remaining))
+    path, index = [], {}
+    while p not in index:
+        index[p] = len(path)
+        path.append(p)
+        p = predecessors[p]
+    cycle = path[index[p]:][::-1]
+    return cycle + cycle[:1]
+
+
+class PageOrder:
+    # Ordering rules, reusable across updates. The order of an update only depends on
+    # its set of pages, and many updates share the same pages, so orders are cached.
+    def __init__(self, ordering_pairs: List[Tuple[int, int]]):
+        self.rules = compile_rules(ordering_pairs)
+        self.predecessors = compile_rules((b, a) for a, b in ordering_pairs)
+        self.ranks: Dict[FrozenSet[int], Dict[int, int]] = {}
+
+    def is_correct(self, pns: List[int]) -> bool:
+        return is_correct_order(pns, self.rules)
+
+    def topological_order(self, pages: FrozenSet[int]) -> List[int]:
+        # When the rules order every pair of pages, sorting pages by their number of
+        # predecessors already gives the order
+        indegrees = {p: len(self.predecessors.get(p, no_pages) & pages) for p in pages}
+        order = sorted(pages, key=indegrees.__getitem__)
+        if is_correct_order(order, self.rules):
+            return order
+
+        # Otherwise Kahn's algorithm, on the rules between the given pages only
+        successors = {p: self.rules.get(p, no_pages) & pages for p in pages}
+        ready = sorted((p for p in pages if not indegrees[p]), reverse=True)
+        order = []
+        while ready:
+            p = ready.pop()
+            order.append(p)
+            for b in successors[p]:
+                indegrees[b] -= 1
+                if not indegrees[b]:
+                    ready.append(b)
+
+        if len(order) < len(pages):
+            cycle = find_cycle(successors, pages - set(order))
+            raise CycleError(f"Ordering rules contain a cycle: {' -> '.join(str(p) for p in cycle)}")
+        return order
+
+    def rank(self, pages: FrozenSet[int]) -> Dict[int, int]:
+        ranks = self.ranks.get(pages)
+        if ranks is None:
+            ranks = self.ranks[pages] = {p: i for i, p in enumerate(self.topological_order(pages))}
+        return ranks
+
+    def fix(self, pns: List[int]) -> List[int]:
+        return sorted(pns, key=self.rank(frozenset(pns)).__getitem__)
+
+
 def process_input(input: str):
     ordering_pairs, page_numbers = parse_input(input)
+    rules = compile_rules(ordering_pairs)
     result = 0
 
     for pns in page_numbers:
-        if is_correct_order(pns, ordering_pairs):
+        if is_correct_order(pns, rules):
             result += pns[(len(pns) - 1) // 2]
 
     return result
@@ -32,14 +114,14 @@ def process_input(input: str):
 
 def process_input_incorrect(input: str):
     ordering_pairs, page_numbers = parse_input(input)
+    order = PageOrder(ordering_pairs)
     result = 0
 
     for pns in page_numbers:
-        if is_correct_order(pns, ordering_pairs, flip=True):
+        if order.is_correct(pns):
             continue
 
-        while not is_correct_order(pns, ordering_pairs, flip=True):
-            pass
+        pns = order.fix(pns)
         result += pns[(len(pns) - 1) // 2]
 
     return result
@@ -80,6 +162,15 @@ def example():
     assert process_input(example_input) == 143
     assert process_input_incorrect(example_input) == 123
 
+    cyclic = PageOrder([(1, 2), (2, 3), (3, 1), (3, 4)])
+    assert not cyclic.is_correct([1, 2, 3])
+    assert cyclic.fix([4, 1]) == [1, 4]
+    try:
+        cyclic.fix([4, 3, 2, 1])
+        assert False, "the cycle wasn't detected"
+    except CycleError as e:
+        assert "cycle" in str(e)
+
 
 if __name__ == "__main__":
     example()
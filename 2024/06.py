@@ -1,4 +1,7 @@
-from typing import Set, Tuple
+import re
+from typing import List, Set, Tuple
+
+from common.grid import Grid
 
 
 directions_map = {
@@ -8,74 +11,146 @@ directions_map = {
     "<": (-1, 0),
 }
 
-directions = list(directions_map.values())
+wall, floor, outside = b"#.\0"
+blocking = re.compile(rb"[#\0]")
 
 
-def debug_print(lines, x, y):
+def debug_print(grid: Grid, i: int):
     print("---")
-    for i, l in enumerate(lines):
-        ll = [c for c in l]
-        if i == y:
-            ll[x] = "x"
-        print("".join(ll))
-
+    debug_grid = grid.copy()
+    debug_grid[i] = ord("x")
+    print(debug_grid)
 
-def turn_right(direction: Tuple[int, int]):
-    i = directions.index(direction)
-    return directions[(i + 1) % 4]
 
+def turn_right(direction: int, grid: Grid) -> int:
+    # Directions are offsets in the grid, in the same order as `directions_map`
+    offsets = (grid.up, grid.right, grid.down, grid.left)
+    i = offsets.index(direction)
+    return offsets[(i + 1) % 4]
 
-def navigate_map(map: str, detect_loops=False):
-    lines = map.strip().splitlines()
-    lines = [list(l) for l in lines]
 
-    h = len(lines)
-    w = len(lines[0])
-    y = next(y for y in range(len(lines)) if list(filter(lambda c: c not in (".", "#"), lines[y])))
-    x = next(x for x in range(len(lines[y])) if lines[y][x] not in (".", "#"))
+def parse_map(map: str) -> Tuple[Grid, int, int]:
+    grid = Grid.parse(map)
+    # Only one of the arrows is on the map, the others are not found (-1)
+    i = max(grid.find(c) for c in directions_map)
+    dx, dy = directions_map[chr(grid[i])]
+    direction = dy * grid.stride + dx
+    grid[i] = floor
+    return grid, i, direction
 
-    direction = directions_map[lines[y][x]]
-    lines[y][x] = "."
 
-    stepped: Set[Tuple[int, int]] = set([(x, y)])
-    previous_states: Set[Tuple[Tuple[int, int], Tuple[int, int]]] = set()
+def walk(grid: Grid, i: int, direction: int, detect_loops=False):
+    stepped: Set[int] = set([i])
+    previous_states: Set[Tuple[int, int]] = set()
     while True:
-        # debug_print(lines, x, y)
+        # debug_print(grid, i)
 
-        state = ((x, y), direction)
+        state = (i, direction)
         if state in previous_states and detect_loops:
             return None
         previous_states.add(state)
 
-        x1, y1 = x + direction[0], y + direction[1]
-        if x1 < 0 or x1 >= w or y1 < 0 or y1 >= h:
+        i1 = i + direction
+        if grid[i1] == outside:
             break
-        elif lines[y1][x1] == "#":
-            direction = turn_right(direction)
+        elif grid[i1] == wall:
+            direction = turn_right(direction, grid)
         else:
-            x, y = x1, y1
-            stepped.add((x, y))
+            i = i1
+            stepped.add(i)
 
     return stepped
 
 
-def find_loops(map: str):
-    lines = map.strip().splitlines()
-    stepped = navigate_map(map)
-    loops = 0
+def jump_table(grid: Grid) -> List[List[int]]:
+    # For each direction (in the order of turn_right) and each floor cell, the cell where the
+    # guard stops in front of the next wall, or ~cell of the last cell before leaving the map.
+    # Rows, and columns (slices of the flat grid with a step), are split by walls and border
+    # cells, all the cells between two of them stop at the same cells.
+    cells = grid.cells
+    up, right, down, left = ([0] * len(cells) for _ in range(4))
+    for step, forward, backward in ((grid.right, right, left), (grid.down, down, up)):
+        for r in range(step):
+            line = cells[r::step]
+            ends = [m.start() for m in blocking.finditer(line)]
+            for a, b in zip(ends, ends[1:]):
+                if b - a < 2:
+                    continue
+                first, last = r + (a + 1) * step, r + (b - 1) * step
+                forward[first:last + 1:step] = [last if line[b] == wall else ~last] * (b - a - 1)
+                backward[first:last + 1:step] = [first if line[a] == wall else ~first] * (b - a - 1)
+    return [up, right, down, left]
+
+
+def walk_jumps(grid: Grid, i: int, direction: int, detect_loops=False):
+    # Same as walk, jumping from wall to wall. A loop always goes through the same turn
+    # again, so only turns are remembered.
+    jumps = jump_table(grid)
+    offsets = (grid.up, grid.right, grid.down, grid.left)
+    k = offsets.index(direction)
+    stepped: Set[int] = set([i])
+    turns: Set[Tuple[int, int]] = set()
+    while True:
+        d = offsets[k]
+        j = jumps[k][i]
+        last = ~j if j < 0 else j
+        stepped.update(range(i, last + d, d))
+        if j < 0:
+            return stepped
+
+        if detect_loops:
+            if (j, k) in turns:
+                return None
+            turns.add((j, k))
+        i, k = j, (k + 1) % 4
+
 
-    for x, y in stepped:
-        if lines[y][x] != ".":
-            continue
+def navigate_map(map: str, detect_loops=False):
+    grid, i, direction = parse_map(map)
+    return walk_jumps(grid, i, direction, detect_loops)
+
+
+def loops_with_obstacle(jumps: List[List[int]], offsets: Tuple[int, ...], i: int, k: int, obstacle: int) -> bool:
+    # Same as walk_jumps with an extra wall at obstacle, on top of the jump table: only
+    # the jumps that cross the obstacle are cut short
+    turns: Set[Tuple[int, int]] = set()
+    while True:
+        d = offsets[k]
+        j = jumps[k][i]
+        last = ~j if j < 0 else j
+        steps, rest = divmod(obstacle - i, d)
+        if rest == 0 and 0 < steps <= (last - i) // d:
+            j = obstacle - d
+        elif j < 0:
+            return False
 
-        new_lines = [list(l) for l in lines]
-        new_lines[y][x] = "#"
+        if (j, k) in turns:
+            return True
+        turns.add((j, k))
+        i, k = j, (k + 1) % 4
 
-        result = navigate_map("\n".join("".join(l) for l in new_lines), detect_loops=True)
-        if result is None:
-            loops += 1
 
-    return loops
+def find_loops(map: str):
+    grid, i, direction = parse_map(map)
+    jumps = jump_table(grid)
+    offsets = (grid.up, grid.right, grid.down, grid.left)
+    k = offsets.index(direction)
+    stepped = {i}
+    loops = 0
+
+    # Follows the path of the guard, an obstacle on a cell only changes the path from the
+    # first time the guard reaches it, so each trial starts from the cell just before
+    while True:
+        d = offsets[k]
+        j = jumps[k][i]
+        last = ~j if j < 0 else j
+        for c in range(i + d, last + d, d):
+            if c not in stepped:
+                stepped.add(c)
+                loops += loops_with_obstacle(jumps, offsets, c - d, k, c)
+        if j < 0:
+            return loops
+        i, k = j, (k + 1) % 4
 
 
 example_map = """
@@ -94,6 +169,7 @@ example_map = """
 
 def example():
     assert len(navigate_map(example_map)) == 41
+    assert navigate_map(example_map) == walk(*parse_map(example_map))
     assert find_loops(example_map) == 6
 
 
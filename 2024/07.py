@@ -3,6 +3,8 @@ from itertools import product
 from operator import add, mul
 from typing import List, Tuple
 
+from common.ints import extract_ints
+
 
 def concat_num(a: int, b: int) -> int:
     return int(f"{a}{b}")
@@ -13,8 +15,8 @@ operators_v2 = operators + [concat_num]
 
 
 def parse_equations(input: str) -> List[Tuple[int, List[int]]]:
-    lines = [l.split(": ") for l in input.strip().splitlines()]
-    return [(int(l[0]), [int(i) for i in l[1].split()]) for l in lines]
+    lines = [extract_ints(l) for l in input.strip().splitlines()]
+    return [(l[0], l[1:]) for l in lines]
 
 
 def process_equations(input: str, operators=operators) -> int:
@@ -1,48 +1,46 @@
-from typing import List, Set, Tuple
+from typing import Set, Tuple
 
-Map = List[List[int]]
-Visited = List[List[bool]]
-UniqueCoords = Set[Tuple[int, int]]
+from common.grid import Grid
 
+Visited = bytearray
+UniqueCells = Set[int]
 
-def parse_map(s: str) -> Map:
-    return [[int(c) for c in l] for l in s.strip().splitlines()]
+top = ord("9")
 
 
-def get_valid_neighbors(map, x, y, visited):
-    h = len(map)
-    w = len(map[0])
-    current = map[y][x]
-    candidates = [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]
+def parse_map(s: str) -> Grid:
+    return Grid.parse(s)
+
+
+def get_valid_neighbors(map: Grid, i: int, visited: Visited):
+    current = map[i]
     neighbors = []
-    for xx, yy in candidates:
-        if xx < 0 or xx >= w or yy < 0 or yy >= h:
-            continue
-        if visited[yy][xx]:
+    for offset in map.neighbors:
+        ii = i + offset
+        if visited[ii]:
             continue
-        if map[yy][xx] - current == 1:
-            neighbors.append((xx, yy))
+        # Border cells are never one higher than a height
+        if map[ii] - current == 1:
+            neighbors.append(ii)
     return neighbors
 
 
-def trail_score_dfs(map: Map, x: int, y: int, visited: Visited=None) -> Tuple[UniqueCoords, int]:
-    if map[y][x] == 9:
-        return {(x, y)}, 1
+def trail_score_dfs(map: Grid, i: int, visited: Visited=None) -> Tuple[UniqueCells, int]:
+    if map[i] == top:
+        return {i}, 1
 
-    h = len(map)
-    w = len(map[0])
     tops = set()
     score = 0
 
     if visited is None:
-        visited = [[False for _ in range(w)] for _ in range(h)]
+        visited = bytearray(len(map.cells))
 
-    valid_neighbors = get_valid_neighbors(map, x, y, visited)
+    valid_neighbors = get_valid_neighbors(map, i, visited)
 
-    for xx, yy in valid_neighbors:
-        visited = [[v for v in l] for l in visited]
-        visited[y][x] = True
-        new_tops, new_score = trail_score_dfs(map, xx, yy, visited)
+    for ii in valid_neighbors:
+        visited = bytearray(visited)
+        visited[i] = True
+        new_tops, new_score = trail_score_dfs(map, ii, visited)
         tops |= new_tops
         score += new_score
 
@@ -53,13 +51,12 @@ def process(s: str):
     map = parse_map(s)
     total_score = 0
     total_score_distinct = 0
-    for y, l in enumerate(map):
-        for x, n in enumerate(l):
-            if n == 0:
-                tops, score = trail_score_dfs(map, x, y)
-                # print(x, y, tops)
-                total_score += len(tops)
-                total_score_distinct += score
+    for i in map.indices():
+        if map[i] == ord("0"):
+            tops, score = trail_score_dfs(map, i)
+            # print(map.coords(i), tops)
+            total_score += len(tops)
+            total_score_distinct += score
 
     return total_score, total_score_distinct
 
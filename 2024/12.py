@@ -1,57 +1,54 @@
 from collections import defaultdict
-from copy import deepcopy
-from itertools import groupby
 from typing import List, Tuple
 
+from common.grid import Grid
 
-Map = List[List[str]]
-Painted = List[List[bool]]
+
+Map = Grid
+Painted = bytearray
 Edges = List[Tuple[int, int]]
 
 
 def parse_map(s: str) -> Map:
-    return [[c for c in l] for l in s.strip().splitlines()]
+    return Grid.parse(s)
 
 
-def get_neighbors(x: int, y: int, map: Map):
-    h = len(map)
-    w = len(map[0])
-    current = map[y][x]
+def get_neighbors(i: int, map: Map):
+    x, y = map.coords(i)
+    current = map[i]
     # Edges are set at .25 offsets so that in the following shape,
     # the inner left edge and inner right edge at O have distinct x values:
     # aaa
     # aOa
     # aaa
     candidates = [
-        (x - 1, y, x - 0.25, y),
-        (x + 1, y, x + 0.25, y),
-        (x, y - 1, x, y - 0.25),
-        (x, y + 1, x, y + 0.25)
+        (i + map.left, x - 0.25, y),
+        (i + map.right, x + 0.25, y),
+        (i + map.up, x, y - 0.25),
+        (i + map.down, x, y + 0.25)
     ]
     neighbors = []
     edges = []
-    for xx, yy, ex, ey in candidates:
-        if xx < 0 or xx >= w or yy < 0 or yy >= h:
-            edges.append((ex, ey))
-            continue
-        if map[yy][xx] == current:
-            neighbors.append((xx, yy))
+    for ii, ex, ey in candidates:
+        # Border cells never match a plant, so they are edges too
+        if map[ii] == current:
+            neighbors.append(ii)
         else:
             edges.append((ex, ey))
     return neighbors, edges
 
 
 
-def paint(x: int, y: int, map: Map, painted: Painted) -> Tuple[int, int, Edges]:
-    painted[y][x] = True
+def paint(i: int, map: Map, painted: Painted) -> Tuple[int, int, Edges]:
+    painted[i] = True
 
-    neighbors, edges = get_neighbors(x, y, map)
+    neighbors, edges = get_neighbors(i, map)
     area = 1
     perimeter = 4 - len(neighbors)
-    for xx, yy in neighbors:
-        if painted[yy][xx]:
+    for ii in neighbors:
+        if painted[ii]:
             continue
-        new_area, new_perimeter, new_edges = paint(xx, yy, map, painted)
+        new_area, new_perimeter, new_edges = paint(ii, map, painted)
         area += new_area
         perimeter += new_perimeter
         edges += new_edges
@@ -86,30 +83,28 @@ def count_sides(edges: List[Tuple[int, int]]) -> int:
 
 
 def debug(map: Map, painted: Painted):
-    h = len(map)
-    w = len(map[0])
-    for y in range(h):
+    for y in range(map.height):
         l = ""
-        for x in range(w):
-            l += "#" if painted[y][x] else map[y][x]
+        for x in range(map.width):
+            i = map.index(x, y)
+            l += "#" if painted[i] else chr(map[i])
         print(l)
 
 
 def cost(input: str, bulk=False) -> int:
     map = parse_map(input)
     total = 0
-    painted = [[False for _ in l] for l in map]
+    painted = bytearray(len(map.cells))
     # debug(map, painted)
-    for y in range(len(map)):
-        for x in range(len(map[0])):
-            if not painted[y][x]:
-                area, perimeter, edges = paint(x, y, map, painted)
-                # print(f"Adding area {area} * perimeter {perimeter} = {area * perimeter}")
-                # debug(map, painted)
-                if bulk:
-                    total += area * count_sides(edges)
-                else:
-                    total += area * perimeter
+    for i in map.indices():
+        if not painted[i]:
+            area, perimeter, edges = paint(i, map, painted)
+            # print(f"Adding area {area} * perimeter {perimeter} = {area * perimeter}")
+            # debug(map, painted)
+            if bulk:
+                total += area * count_sides(edges)
+            else:
+                total += area * perimeter
     return total
 
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Tuple
 
+from common.ints import extract_ints, records
+
 @dataclass
 class Coords:
     x: int
@@ -16,15 +18,11 @@ class Machine:
 
 def parse_machines(s: str, increase=False):
     i = 10000000000000 if increase else 0
-    def parse_machine(m: str):
-        lines = m.splitlines()
-        return Machine(
-            a=Coords(*[int(l.split("+")[1]) for l in lines[0].split(",")]),
-            b=Coords(*[int(l.split("+")[1]) for l in lines[1].split(",")]),
-            p=Coords(*[int(l.split("=")[1]) + i for l in lines[2].split(",")]),
-        )
-
-    machines = [parse_machine(l) for l in s.strip().split("\n\n")]
+    # Each machine is 6 numbers: A x, A y, B x, B y, prize x, prize y
+    machines = [
+        Machine(a=Coords(ax, ay), b=Coords(bx, by), p=Coords(px + i, py + i))
+        for ax, ay, bx, by, px, py in records(extract_ints(s), 6)
+    ]
     return machines
 
 
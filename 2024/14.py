@@ -4,6 +4,8 @@ from operator import mul
 import time
 from typing import List
 
+from common.ints import extract_ints, records
+
 
 @dataclass
 class Vec2:
@@ -18,14 +20,8 @@ class Robot:
 
 
 def parse_robots(s: str):
-    def parse_robot(r: str):
-        parts = r.split(" ")
-        return Robot(
-            p=Vec2(*[int(p) for p in parts[0].split("p=")[1].split(",")]),
-            v=Vec2(*[int(p) for p in parts[1].split("v=")[1].split(",")]),
-        )
-
-    robots = [parse_robot(l) for l in s.strip().splitlines()]
+    # Each robot is 4 numbers: "p=px,py v=vx,vy"
+    robots = [Robot(p=Vec2(px, py), v=Vec2(vx, vy)) for px, py, vx, vy in records(extract_ints(s), 4)]
     return robots
 
 
@@ -1,15 +1,21 @@
-from typing import Callable, List, Tuple
+from typing import List, Tuple
 
+from common.grid import Grid
 
-Map = List[List[str]]
 
+Map = Grid
 
-cardinals: Callable[[str, int, int], Tuple[int, int]] = lambda d, x, y: {
-    "^": (x, y - 1),
-    "v": (x, y + 1),
-    "<": (x - 1, y),
-    ">": (x + 1, y),
-}[d]
+
+wall, box, box_left, box_right, empty, robot = b"#O[].@"
+
+
+def cardinal(map: Map, d: str) -> int:
+    return {
+        "^": map.up,
+        "v": map.down,
+        "<": map.left,
+        ">": map.right,
+    }[d]
 
 
 def widen(s: str):
@@ -21,111 +27,103 @@ def parse_input(s: str, wide=False) -> Tuple[Map, List[str]]:
     if wide:
         raw_map = widen(raw_map)
 
-    map = [[c for c in l] for l in raw_map.strip().splitlines()]
+    map = Grid.parse(raw_map, border="#")
     directions = [c for c in "".join(raw_inputs.splitlines())]
 
     return map, directions
 
 
-def push(map: Map, d: str, w: int, h: int, x: int, y: int):
+def push(map: Map, d: str, i: int):
+    offset = cardinal(map, d)
     boxes = []
     blocked = False
     pushing = True
-    cx, cy = x, y
+    ci = i
     while pushing:
-        nx, ny = cardinals(d, cx, cy)
-        match map[ny][nx]:
-            case ".":
-                pushing = False
-            case "#":
-                pushing = False
-                blocked = True
-            case "O":
-                boxes.append((nx, ny))
-        cx, cy = nx, ny
+        ni = ci + offset
+        c = map[ni]
+        if c == empty:
+            pushing = False
+        elif c == wall:
+            pushing = False
+            blocked = True
+        elif c == box:
+            boxes.append(ni)
+        ci = ni
 
     if not blocked:
-        for bx, by in boxes:
-            nbx, nby = cardinals(d, bx, by)
-            map[nby][nbx] = "O"
-        nx, ny = cardinals(d, x, y)
-        map[ny][nx] = "@"
-        map[y][x] = "."
-        return nx, ny
-    return x, y
+        for bi in boxes:
+            map[bi + offset] = box
+        map[i + offset] = robot
+        map[i] = empty
+        return i + offset
+    return i
 
 
-def push_wide(map: Map, d: str, w: int, h: int, x: int, y: int):
+def push_wide(map: Map, d: str, i: int):
+    offset = cardinal(map, d)
     boxes_l = []
     boxes_r = []
 
     blocked = False
-    stack = [(x, y)]
+    stack = [i]
     done = set()
 
     while True:
         if len(stack) == 0:
             break
 
-        cx, cy = stack.pop(0)
-        nx, ny = cardinals(d, cx, cy)
-
-        match map[ny][nx]:
-            case ".":
-                pass
-            case "#":
-                blocked = True
-                break
-            case "[":
-                boxes_l.append((nx, ny))
-                boxes_r.append((nx + 1, ny))
-                if (nx, ny) not in done:
-                    stack.append((nx, ny))
-                    done.add((nx, ny))
-                if (nx + 1, ny) not in done:
-                    stack.append((nx + 1, ny))
-                    done.add((nx + 1, ny))
-            case "]":
-                boxes_l.append((nx - 1, ny))
-                boxes_r.append((nx, ny))
-                if (nx, ny) not in done:
-                    stack.append((nx, ny))
-                    done.add((nx, ny))
-                if (nx - 1, ny) not in done:
-                    stack.append((nx - 1, ny))
-                    done.add((nx - 1, ny))
+        ci = stack.pop(0)
+        ni = ci + offset
+        c = map[ni]
+
+        if c == wall:
+            blocked = True
+            break
+        elif c == box_left:
+            boxes_l.append(ni)
+            boxes_r.append(ni + 1)
+            if ni not in done:
+                stack.append(ni)
+                done.add(ni)
+            if ni + 1 not in done:
+                stack.append(ni + 1)
+                done.add(ni + 1)
+        elif c == box_right:
+            boxes_l.append(ni - 1)
+            boxes_r.append(ni)
+            if ni not in done:
+                stack.append(ni)
+                done.add(ni)
+            if ni - 1 not in done:
+                stack.append(ni - 1)
+                done.add(ni - 1)
 
     if not blocked:
-        for bx, by in boxes_l + boxes_r:
-            map[by][bx] = "."
+        for bi in boxes_l + boxes_r:
+            map[bi] = empty
 
-        for bx, by in boxes_l:
-            nbx, nby = cardinals(d, bx, by)
-            map[nby][nbx] = "["
-            map[nby][nbx + 1] = "]"
+        for bi in boxes_l:
+            map[bi + offset] = box_left
+            map[bi + offset + 1] = box_right
 
-        nx, ny = cardinals(d, x, y)
-        map[ny][nx] = "@"
-        map[y][x] = "."
+        map[i + offset] = robot
+        map[i] = empty
 
-        return nx, ny
-    return x, y
+        return i + offset
+    return i
 
 
 
 def debug_print(map: Map):
-    for l in map:
-        print("".join(l))
+    print(map)
     print()
 
 
 def process(s: str, wide=False, debug=False):
     map, directions = parse_input(s, wide=wide)
 
-    h = len(map)
-    w = len(map[0])
-    y = next(i for i in range(h) if "@" in map[i])
-    x = next(i for i in range(w) if map[y][i] == "@")
+    i = map.find("@")
 
     if debug:
         print("Initial state:")
@@ -134,17 +132,17 @@ def process(s: str, wide=False, debug=False):
     p = push_wide if wide else push
 
     for d in directions:
-        x, y = p(map, d=d, w=w, h=h, x=x, y=y)
+        i = p(map, d=d, i=i)
         if debug:
             print("Move " + d + ":")
             debug_print(map)
 
     total_gps = 0
-    for y, l in enumerate(map):
-        for x, c in enumerate(l):
-            if c not in ["O", "["]:
-                continue
-            total_gps += 100 * y + x
+    for i in map.indices():
+        if map[i] not in (box, box_left):
+            continue
+        x, y = map.coords(i)
+        total_gps += 100 * y + x
     return total_gps
 
 
@@ -1,98 +1,56 @@
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple
-import heapq
+from typing import Set, Tuple
 
+from common.grid import Grid
+from common.search import dijkstra_all, on_shortest_paths
 
-Maze = List[List[str]]
 
+Maze = Grid
 
-@dataclass(frozen=True)
-class Vec2:
-    x: int
-    y: int
+wall = ord("#")
 
-    def inverse(self):
-        return Vec2(-self.x, -self.y)
 
-    def __add__(self, other: "Vec2"):
-        return Vec2(self.x + other.x, self.y + other.y)
+def parse_maze(s: str) -> Tuple[Maze, int, int]:
+    # Start and end are packed positions, see Grid.index
+    maze = Grid.parse(s, border="#")
+    start = maze.find("S")
+    end = maze.find("E")
 
-    def __lt__(self, other):
-        return (self.x, self.y) < (other.x, other.y)
+    return maze, start, end
 
 
-all_directions = [
-    Vec2(0, -1),
-    Vec2(0, 1),
-    Vec2(-1, 0),
-    Vec2(1, 0),
-]
-
-
-def parse_maze(s: str) -> Tuple[Maze, Vec2, Vec2]:
-    lines = []
-    start = None
-    end = None
-    for y, l in enumerate(s.strip().splitlines()):
-        l = [c for c in l]
-        lines.append(l)
-        if "S" in l:
-            start = Vec2(x=l.index("S"), y=y)
-        elif "E" in l:
-            end = Vec2(x=l.index("E"), y=y)
-
-    return lines, start, end
-
-
-def get_valid_directions(maze: Maze, p: Vec2, d: Vec2, size: Vec2):
-    w, h = size.x, size.y
-    x, y = p.x, p.y
-
+def get_valid_directions(maze: Maze, p: int, d: int):
     directions = []
-    candidates = [dd for dd in all_directions if dd != d.inverse()]
+    # Directions are offsets of packed positions (see Grid.index), the inverse of d is -d
+    candidates = [dd for dd in maze.neighbors if dd != -d]
 
     for dd in candidates:
-        xx, yy = x + dd.x, y + dd.y
-        if xx < 0 or xx >= w or yy < 0 or yy >= h:
-            continue
-        if maze[yy][xx] == "#":
+        # The maze is surrounded by walls, no need for bounds checks
+        if maze[p + dd] == wall:
             continue
         directions.append(dd)
 
     return directions
 
 
-def navigate_dijkstra(maze: Maze, start: Vec2, end: Vec2):
-    size = Vec2(len(maze[0]), len(maze))
+def navigate_dijkstra(maze: Maze, start: int, end: int):
+    # Search nodes are (position, direction) states packed into an int as position * 4 + k,
+    # where k is the index of the direction in maze.neighbors
+    direction_index = {d: k for k, d in enumerate(maze.neighbors)}
 
-    visited: Dict[Vec2, int] = {}
-    lowest_seats: Set[Vec2] = set()
-    min_score = float("inf")
+    def neighbors(node: int):
+        cur_pos, k = divmod(node, 4)
+        cur_dir = maze.neighbors[k]
+        for new_dir in get_valid_directions(maze, cur_pos, cur_dir):
+            new_score = 1001 if new_dir != cur_dir else 1
+            yield (cur_pos + new_dir) * 4 + direction_index[new_dir], new_score
 
-    priority_queue: List[Tuple[int, Vec2, Vec2, List[Vec2]]] = []
-    heapq.heappush(priority_queue, (0, start, Vec2(1, 0), [start]))
+    start_node = start * 4 + direction_index[maze.right]
+    end_nodes = {end * 4 + k for k in range(4)}
+    scores, predecessors = dijkstra_all([start_node], neighbors, goals=end_nodes)
 
-    while priority_queue:
-        score, cur_pos, cur_dir, path = heapq.heappop(priority_queue)
-
-        if score > min_score:
-            break
-
-        if cur_pos == end:
-            if score < min_score:
-                lowest_seats.clear()
-                min_score = score
-            lowest_seats |= set(path)
-
-        visited[(cur_pos, cur_dir)] = score
-
-        for new_dir in get_valid_directions(maze, cur_pos, cur_dir, size):
-            new_score = score + (1001 if new_dir != cur_dir else 1)
-            new_pos = cur_pos + new_dir
-
-            if new_score < visited.get((new_pos, new_dir), float("inf")):
-                heapq.heappush(priority_queue, (new_score, new_pos, new_dir, path + [new_pos]))
+    min_score = min(scores.get(e, float("inf")) for e in end_nodes)
+    best_ends = [e for e in end_nodes if scores.get(e) == min_score]
+    lowest_seats: Set[int] = {node // 4 for node in on_shortest_paths(predecessors, best_ends)}
 
     return min_score, len(lowest_seats)
 
@@ -149,6 +107,10 @@ def example():
     assert seats1 == 45
     assert seats2 == 64
 
+    # Zero-weight edges can reach a start again, from another start or from itself
+    assert dijkstra_all([0, 1], [[(1, 0)], [(2, 1)], []]) == ({0: 0, 1: 0, 2: 1}, {0: [], 1: [0], 2: [1]})
+    assert dijkstra_all([0], [[(1, 0)], [(0, 0)]]) == ({0: 0, 1: 0}, {0: [1], 1: [0]})
+
 
 if __name__ == "__main__":
     example()
@@ -1,14 +1,13 @@
 from typing import List
 
+from common.ints import extract_ints
+
 
 def parse_program(s: str):
     raw_regs, raw_prog = s.strip().split("\n\n")
-    registers = {
-        left: int(right)
-        for left, right
-        in [l.split("Register ")[1].split(": ") for l in raw_regs.splitlines()]
-    }
-    program = [int(n) for n in raw_prog.split(": ")[1].split(",")]
+    # Registers are always given in the order A, B, C
+    registers = dict(zip("ABC", extract_ints(raw_regs)))
+    program = extract_ints(raw_prog)
 
     return registers, program
 
@@ -1,94 +1,60 @@
-from dataclasses import dataclass
-import heapq
-from typing import Dict, List, Tuple
+from typing import Iterator, List, Tuple
 from bisect import bisect_left
 
+from common.grid import Grid
+from common.inputs import Buffer, iter_chunks, map_input
+from common.ints import extract_ints, records
+from common.search import bfs
 
-@dataclass(frozen=True)
-class Vec2:
-    x: int
-    y: int
 
-    def __add__(self, other: "Vec2"):
-        return Vec2(self.x + other.x, self.y + other.y)
+corrupted = ord("#")
 
-    def __lt__(self, other):
-        return (self.x, self.y) < (other.x, other.y)
 
+def iter_bytes(s: Buffer) -> Iterator[Tuple[int, int]]:
+    # Coordinates are extracted one chunk of lines at a time
+    for chunk in iter_chunks(s):
+        yield from records(extract_ints(chunk), 2)
 
-all_directions = [
-    Vec2(0, -1),
-    Vec2(0, 1),
-    Vec2(-1, 0),
-    Vec2(1, 0),
-]
 
+def parse_bytes(s: Buffer) -> List[Tuple[int, int]]:
+    return list(iter_bytes(s))
 
-def parse_bytes(s: str):
-    return [[int(n) for n in l.split(",")] for l in s.strip().splitlines()]
 
+def debug_print(memory: Grid):
+    print(memory)
 
-def debug_print(memory):
-    for l in memory:
-        print("".join(l))
-
-
-def get_valid_directions(memory, p: Vec2, size: Vec2):
-    w, h = size.x, size.y
-    x, y = p.x, p.y
 
+def get_valid_directions(memory: Grid, p: int):
     directions = []
-
-    for dd in all_directions:
-        xx, yy = x + dd.x, y + dd.y
-        if xx < 0 or xx >= w or yy < 0 or yy >= h:
-            continue
-        if memory[yy][xx] == "#":
+    # Directions are offsets of packed positions, see Grid.index
+    for dd in memory.neighbors:
+        # Memory is surrounded by corrupted bytes, no need for bounds checks
+        if memory[p + dd] == corrupted:
             continue
         directions.append(dd)
 
     return directions
 
 
-def dijkstra(memory, start: Vec2, end: Vec2):
-    size = Vec2(len(memory[0]), len(memory))
+def dijkstra(memory: Grid, start: int, end: int):
+    # Every step costs 1, so a BFS finds the same shortest path
+    scores = bfs([start], lambda p: (p + d for d in get_valid_directions(memory, p)), goal=end)
 
-    visited: Dict[Vec2] = {}
-
-    priority_queue: List[Tuple[int, Vec2]] = []
-    heapq.heappush(priority_queue, (0, start))
-
-    while priority_queue:
-        score, cur_pos = heapq.heappop(priority_queue)
-
-        if cur_pos in visited and visited[cur_pos] <= score:
-            continue
+    return scores.get(end, float("inf"))
 
-        visited[(cur_pos)] = score
 
-        if cur_pos == end:
-            return score
-
-        for new_dir in get_valid_directions(memory, cur_pos, size):
-            new_score = score + 1
-            new_pos = cur_pos + new_dir
-
-            heapq.heappush(priority_queue, (new_score, new_pos))
-
-    return float("inf")
-
-
-def process(s: str, nanoseconds, w=71):
+def process(s: Buffer, nanoseconds, w=71):
     bytes = parse_bytes(s)
-    start, end = Vec2(0, 0), Vec2(w - 1, w - 1)
-
     def fill(nanoseconds):
-        memory = [["." for _ in range(w)] for _ in range(w)]
+        memory = Grid(w, w, border="#")
         for x, y in bytes[:nanoseconds]:
-            memory[y][x] = "#"
+            memory[memory.index(x, y)] = corrupted
         return memory
 
-    part1 = dijkstra(fill(nanoseconds), start, end)
+    memory = fill(nanoseconds)
+    # Packed positions, the same in every filled memory
+    start, end = memory.index(0, 0), memory.index(w - 1, w - 1)
+    part1 = dijkstra(memory, start, end)
 
     # binary search
     left, right = nanoseconds, 1_000_000_000
@@ -142,9 +108,7 @@ def example():
 if __name__ == "__main__":
     example()
 
-    with open("2024/18.input", "r") as f:
-        bytes = f.read()
-
-    part1, part2 = process(bytes, nanoseconds=1024, w=71)
+    with map_input("2024/18.input") as bytes:
+        part1, part2 = process(bytes, nanoseconds=1024, w=71)
     print(part1)
     print(part2)
@@ -1,59 +1,31 @@
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple, Union
-import heapq
+from typing import Dict, Tuple
 
+from common.grid import Grid
+from common.search import bfs
 
-Maze = List[List[str]]
 
+Maze = Grid
+Scores = Dict[int, int]
 
-# From 16.py
-@dataclass(frozen=True)
-class Vec2:
-    x: int
-    y: int
-
-    def inverse(self):
-        return Vec2(-self.x, -self.y)
-
-    def __add__(self, other: "Vec2"):
-        return Vec2(self.x + other.x, self.y + other.y)
+wall = ord("#")
 
-    def __lt__(self, other):
-        return (self.x, self.y) < (other.x, other.y)
 
-    def manhattan(self, other: "Vec2"):
-        return abs(other.x - self.x) + abs(other.y - self.y)
+# From 16.py
+def parse_maze(s: str) -> Tuple[Maze, int, int]:
+    # Start and end are packed positions, see Grid.index
+    maze = Grid.parse(s, border="#")
+    start = maze.find("S")
+    end = maze.find("E")
 
-all_directions = [
-    Vec2(0, -1),
-    Vec2(0, 1),
-    Vec2(-1, 0),
-    Vec2(1, 0),
-]
+    return maze, start, end
 
 
-# From 16.py
-def parse_maze(s: str) -> Tuple[Maze, Vec2, Vec2]:
-    lines = []
-    start = None
-    end = None
-    for y, l in enumerate(s.strip().splitlines()):
-        l = [c for c in l]
-        lines.append(l)
-        if "S" in l:
-            start = Vec2(x=l.index("S"), y=y)
-        elif "E" in l:
-            end = Vec2(x=l.index("E"), y=y)
-
-    return lines, start, end
-
-
-def debug_print(scores: List[List[Union[None, int]]]):
+def debug_print(maze: Maze, scores: Scores):
     print("---")
-    for l in scores:
+    for y in range(maze.height):
         ll = ""
-        for c in l:
+        for x in range(maze.width):
+            c = scores.get(maze.index(x, y))
             if c is None:
                 ll += "  #  "
             else:
@@ -63,25 +35,13 @@ def debug_print(scores: List[List[Union[None, int]]]):
 
 def count_shortcuts(s: str):
     maze, start, end = parse_maze(s)
-    scores = [[None if c == "#" else -1 for c in l] for l in maze]
-    pos = start
-    score = 0
-    scores[pos.y][pos.x] = score
-    path = [start]
 
     # There is only one path possible
-    # Flood fill until the end, and mark the distance at each step
-    while pos != end:
-        for dir in all_directions:
-            next_pos = pos + dir
-            if scores[next_pos.y][next_pos.x] == -1:
-                pos = next_pos
-                path.append(pos)
-                break
-        score += 1
-        scores[pos.y][pos.x] = score
-
-    # debug_print(scores)
+    # Flood fill until the end, the distance of each position is its index in the path
+    distances = bfs([start], lambda p: (p + d for d in maze.neighbors if maze[p + d] != wall), goal=end)
+    path = sorted((p for p in distances if distances[p] <= distances[end]), key=distances.get)
+
+    # debug_print(maze, distances)
 
     simple_shortcuts = 0
     long_shortcuts = 0
@@ -89,10 +49,13 @@ def count_shortcuts(s: str):
     # Navigate through the whole path again
     # For each position i, check the manhattan distance to any next position j in the path
     # If the manhattan distance is smaller than j - a, it's a cheat
+    coords = [maze.coords(p) for p in path]
     ll = len(path)
     for i in range(ll):
+        x0, y0 = coords[i]
         for j in range(i + 102, ll):
-            manhattan = path[i].manhattan(path[j])
+            x1, y1 = coords[j]
+            manhattan = abs(x1 - x0) + abs(y1 - y0)
             dist = j - i
             # We're only interested in savings of 100 or more
             if dist - manhattan < 100:
@@ -1,22 +1,11 @@
-from dataclasses import dataclass
 from functools import cache
 from itertools import permutations
 from typing import Dict, List, Tuple, Union
 
+from common.vec2 import Vec2
 
-Keypad = Union[Tuple[str, str, str, str], Tuple[str, str]]
-
-
-@dataclass(frozen=True)
-class Vec2:
-    x: int
-    y: int
 
-    def __add__(self, other: "Vec2"):
-        return Vec2(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other: "Vec2"):
-        return Vec2(self.x - other.x, self.y - other.y)
+Keypad = Union[Tuple[str, str, str, str], Tuple[str, str]]
 
 
 door_keypad = (
@@ -3,6 +3,8 @@ from collections import defaultdict
 from itertools import chain
 from typing import Dict, List
 
+from common.ints import extract_ints
+
 
 bits = (1 << 24) - 1
 
@@ -36,7 +38,7 @@ def prng(seed: int):
 
 
 def add_secrets(s: str):
-    secrets = [int(n) for n in s.strip().splitlines()]
+    secrets = extract_ints(s)
     total = 0
     for secret in secrets:
         for _ in range(2000):
@@ -63,7 +65,7 @@ def find_all_sequences(initial_secret, secrets) -> Dict[str, int]:
 
 
 def buy_bananas(s: str):
-    secrets = [int(n) for n in s.strip().splitlines()]
+    secrets = extract_ints(s)
     rnds = [prng(s) for s in secrets]
     lists = [list(next(rnd) for _ in range(2000)) for rnd in rnds]
     all_sequences = [find_all_sequences(secrets[i], lists[i]) for i in range(len(secrets))]
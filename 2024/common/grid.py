@@ -0,0 +1,79 @@
+from typing import Iterator
+
+
+class Grid:
+    # Cells are stored row by row in a flat bytearray, one byte per cell, surrounded by
+    # a border of one cell. Neighbors of any cell of the grid are valid indices, so there
+    # is no need for bounds checks: stepping outside lands on a border cell instead.
+    __slots__ = ("width", "height", "stride", "cells", "up", "down", "left", "right", "neighbors", "diagonals")
+
+    def __init__(self, width: int, height: int, fill=".", border="\0"):
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.cells = bytearray(border.encode() * (self.stride * (height + 2)))
+        for y in range(height):
+            start = self.index(0, y)
+            self.cells[start:start + width] = fill.encode() * width
+
+        # Offsets to add to an index to move to a neighbor
+        self.up, self.down, self.left, self.right = -self.stride, self.stride, -1, 1
+        self.neighbors = (self.up, self.down, self.left, self.right)
+        self.diagonals = (
+            self.up + self.left,
+            self.up + self.right,
+            self.down + self.left,
+            self.down + self.right,
+        )
+
+    @classmethod
+    def parse(cls, s: str, border="\0") -> "Grid":
+        lines = s.strip().splitlines()
+        grid = cls(len(lines[0]), len(lines), border=border)
+        for y, l in enumerate(lines):
+            row = l.encode()
+            # A row of another width would resize the cells and shift everything after it
+            if len(row) != grid.width:
+                raise ValueError(f"Line {y} has {len(row)} cells instead of {grid.width}")
+            start = grid.index(0, y)
+            grid.cells[start:start + grid.width] = row
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, i: int):
+        y, x = divmod(i, self.stride)
+        return x - 1, y - 1
+
+    def inside(self, i: int) -> bool:
+        x, y = self.coords(i)
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def indices(self) -> Iterator[int]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, c: str) -> int:
+        return self.cells.find(c.encode())
+
+    def row(self, y: int) -> bytes:
+        start = self.index(0, y)
+        return bytes(self.cells[start:start + self.width])
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+        for attr in Grid.__slots__:
+            setattr(grid, attr, getattr(self, attr))
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, c: int):
+        self.cells[i] = c
+
+    def __str__(self):
+        return "\n".join(self.row(y).decode() for y in range(self.height))
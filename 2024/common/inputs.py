@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+import mmap
+from typing import Iterator, List, Union
+
+
+# Inputs can be given as a str, or as bytes-like buffers such as a memory-mapped file
+Buffer = Union[str, bytes, mmap.mmap]
+
+
+@contextmanager
+def map_input(path: str) -> Iterator[Buffer]:
+    # The file is paged in by the OS as it is read, instead of being copied into a str
+    with open(path, "rb") as f:
+        try:
+            memory = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            yield b""
+            return
+        with memory:
+            yield memory
+
+
+def iter_lines(buffer: Buffer) -> Iterator[str]:
+    # Lines are sliced one at a time, so only one line is copied at any time.
+    # Trailing whitespace (and "\r") is removed, empty lines are kept.
+    newline = "\n" if isinstance(buffer, str) else b"\n"
+    start = 0
+    end = len(buffer)
+    while start < end:
+        i = buffer.find(newline, start)
+        if i == -1:
+            i = end
+        line = buffer[start:i].rstrip()
+        yield line if isinstance(line, str) else line.decode()
+        start = i + 1
+
+
+def iter_chunks(buffer: Buffer, size=1 << 20) -> Iterator[Buffer]:
+    # Slices of about size bytes that end on a line boundary, so no line is split between two chunks
+    newline = "\n" if isinstance(buffer, str) else b"\n"
+    start = 0
+    end = len(buffer)
+    while start < end:
+        i = buffer.find(newline, start + size - 1) if start + size < end else -1
+        i = end if i == -1 else i + 1
+        yield buffer[start:i]
+        start = i
+
+
+def iter_blocks(buffer: Buffer) -> Iterator[List[str]]:
+    # Groups of lines separated by blank lines
+    block = []
+    for l in iter_lines(buffer):
+        if l:
+            block.append(l)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
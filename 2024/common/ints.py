@@ -0,0 +1,58 @@
+from array import array
+import re
+from typing import List, Sequence, Tuple
+
+from common.inputs import Buffer
+
+
+# Everything but digits and minus signs becomes a space, then a single split gives the integers.
+# Translating and splitting happen in C, which is a few times faster than a regex.
+separators = bytes(c if chr(c) in "0123456789-" else ord(" ") for c in range(256))
+
+# Fallback for minus signs that are not signs, e.g. "kh-tc" or "3-4": a minus sign
+# following a digit is a separator
+int_pattern = re.compile(rb"(?:(?<![0-9])-)?[0-9]+")
+
+
+def _bytes(buffer: Buffer) -> bytes:
+    if isinstance(buffer, str):
+        return buffer.encode()
+    elif not isinstance(buffer, bytes):
+        return buffer[:]
+    return buffer
+
+
+def _tokens(buffer: Buffer) -> List[bytes]:
+    buffer = _bytes(buffer)
+    tokens = buffer.translate(separators).split()
+    if b"-" in buffer and any(t == b"-" or b"-" in t[1:] for t in tokens):
+        tokens = int_pattern.findall(buffer)
+    return tokens
+
+
+def extract_ints(buffer: Buffer) -> List[int]:
+    # All the signed integers of a buffer in one pass, e.g. "p=0,4 v=3,-3" -> [0, 4, 3, -3]
+    return list(map(int, _tokens(buffer)))
+
+
+def extract_array(buffer: Buffer, typecode="q") -> array:
+    # Same as extract_ints, stored as 8 bytes per int instead of one Python object each
+    return array(typecode, map(int, _tokens(buffer)))
+
+
+def extract_numpy(buffer: Buffer):
+    # NumPy is optional, it is only needed by this function
+    import numpy as np
+
+    buffer = _bytes(buffer)
+    if b"-" in buffer:
+        return np.frombuffer(extract_array(buffer), dtype=np.int64)
+    # Without minus signs, NumPy can parse the translated buffer itself, without creating any Python int
+    return np.fromstring(buffer.translate(separators), dtype=np.int64, sep=" ")
+
+
+def records(ints: Sequence[int], width: int) -> List[Tuple[int, ...]]:
+    # Fixed width records, e.g. records([0, 4, 3, -3], 2) -> [(0, 4), (3, -3)]
+    if len(ints) % width != 0:
+        raise ValueError(f"{len(ints)} integers can't be split in records of {width}")
+    return list(zip(*[iter(ints)] * width))
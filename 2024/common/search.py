@@ -0,0 +1,103 @@
+from collections import deque
+import heapq
+from typing import Callable, Collection, Dict, Iterable, List, Sequence, Set, Tuple, Union
+
+
+# Nodes are ints (e.g. packed positions, see common.grid.Grid.index).
+# Neighbors are given either by a callback, or by adjacency lists indexed by node.
+Neighbors = Union[Callable[[int], Iterable[int]], Sequence[Iterable[int]]]
+WeightedNeighbors = Union[Callable[[int], Iterable[Tuple[int, int]]], Sequence[Iterable[Tuple[int, int]]]]
+Predecessors = Dict[int, List[int]]
+
+
+def _callback(neighbors):
+    return neighbors if callable(neighbors) else neighbors.__getitem__
+
+
+def bfs(starts: Iterable[int], neighbors: Neighbors, goal: int = None) -> Dict[int, int]:
+    # Distances from the closest start for unit weights, stops as soon as the goal is reached
+    neighbors = _callback(neighbors)
+    distances = {s: 0 for s in starts}
+    queue = deque(distances)
+
+    while queue:
+        node = queue.popleft()
+        if node == goal:
+            break
+        distance = distances[node] + 1
+        for n in neighbors(node):
+            if n not in distances:
+                distances[n] = distance
+                queue.append(n)
+
+    return distances
+
+
+def _dijkstra(starts: Iterable[int], neighbors: WeightedNeighbors, goals: Collection[int], predecessors: Predecessors = None):
+    neighbors = _callback(neighbors)
+    distances = {s: 0 for s in starts}
+    queue = [(0, s) for s in distances]
+    heapq.heapify(queue)
+    goal_distance = None
+    if predecessors is not None:
+        # Starts can be reached again at the same distance, with zero-weight edges
+        predecessors.update((s, []) for s in distances)
+
+    while queue:
+        distance, node = heapq.heappop(queue)
+
+        # Instead of decreasing keys in the queue, improved nodes are pushed again,
+        # and outdated entries are skipped when they are popped
+        if distance > distances[node]:
+            continue
+
+        if goal_distance is not None and distance > goal_distance:
+            break
+        if node in goals:
+            # Without predecessors nothing more is needed, with them, other
+            # paths of the same length can still be found until the distance grows
+            if predecessors is None:
+                break
+            goal_distance = distance
+
+        for n, weight in neighbors(node):
+            new_distance = distance + weight
+            old_distance = distances.get(n)
+            if old_distance is None or new_distance < old_distance:
+                distances[n] = new_distance
+                heapq.heappush(queue, (new_distance, n))
+                if predecessors is not None:
+                    predecessors[n] = [node]
+            elif new_distance == old_distance and predecessors is not None:
+                predecessors[n].append(node)
+
+    return distances
+
+
+def dijkstra(starts: Iterable[int], neighbors: WeightedNeighbors, goals: Collection[int] = ()) -> Dict[int, int]:
+    # Distances from the closest start, stops as soon as one of the goals is reached.
+    # Distances of nodes that were not reached yet at that point are upper bounds.
+    return _dijkstra(starts, neighbors, goals)
+
+
+def dijkstra_all(
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    goals: Collection[int] = (),
+) -> Tuple[Dict[int, int], Predecessors]:
+    # Same as dijkstra(), but also keeps every predecessor of a node on an optimal path to it
+    predecessors: Predecessors = {}
+    distances = _dijkstra(starts, neighbors, goals, predecessors)
+    return distances, predecessors
+
+
+def on_shortest_paths(predecessors: Predecessors, ends: Iterable[int]) -> Set[int]:
+    # All nodes of all the optimal paths leading to the ends, walking back the predecessors
+    nodes = set(ends)
+    stack = list(nodes)
+    while stack:
+        for p in predecessors.get(stack.pop(), ()):
+            if p not in nodes:
+                nodes.add(p)
+                stack.append(p)
+    return nodes
@@ -0,0 +1,39 @@
+class Vec2:
+    # Immutable and slotted, cheaper to build and hash than a frozen dataclass. Search loops
+    # use positions packed in an int instead (see common.grid.Grid.index), which are cheaper
+    # still as heap entries, dict keys and set members.
+    __slots__ = ("x", "y")
+
+    x: int
+    y: int
+
+    def __init__(self, x: int, y: int):
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Vec2 is immutable, cannot set {name}")
+
+    def __add__(self, other: "Vec2") -> "Vec2":
+        return Vec2(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: "Vec2") -> "Vec2":
+        return Vec2(self.x - other.x, self.y - other.y)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Vec2) and self.x == other.x and self.y == other.y
+
+    def __lt__(self, other: "Vec2") -> bool:
+        return (self.x, self.y) < (other.x, other.y)
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __repr__(self):
+        return f"Vec2(x={self.x}, y={self.y})"
+
+    def inverse(self) -> "Vec2":
+        return Vec2(-self.x, -self.y)
+
+    def manhattan(self, other: "Vec2") -> int:
+        return abs(other.x - self.x) + abs(other.y - self.y)
@@ -0,0 +1,130 @@
+import argparse
+from functools import partial
+import os
+from pathlib import Path
+import sys
+
+from aoc.bench import baseline_path, bench_day, compare, format_results, load_baseline, save_baseline
+from aoc.cache import AnswerCache
+from aoc.days import normalize_day, solvers
+from aoc.generators import generate
+from aoc.runner import execute_profiled, execute_traced, run_days
+from aoc.timing import format_seconds, measure
+
+
+def parse_parts(s: str):
+    return tuple(int(p) for p in s.split(","))
+
+
+def parse_scales(s: str):
+    return tuple(float(n) for n in s.split(","))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run and time the solvers of one or more days")
+    run.add_argument("year")
+    run.add_argument("days", nargs="+")
+    run.add_argument("--parts", type=parse_parts, default=(1, 2), help="comma separated, e.g. 1,2")
+    run.add_argument("--repeat", type=int, default=1, help="number of timed runs per part")
+    run.add_argument("--input", type=Path, help="input file to use instead of YYYY/DD.input")
+    run.add_argument("--scale", type=float, help="use a generated input, scaled relative to an official input")
+    run.add_argument("--seed", type=int, default=0, help="seed of the generated input")
+    run.add_argument("--no-cache", action="store_true", help="always run the solvers, and don't store their answers")
+    run.add_argument("--cache-size", type=int, default=10, help="maximum size of the answer cache, in MB")
+    run.add_argument("--profile", action="store_true", help="profile each part, write profiles/*.pstats and collapsed stacks")
+    run.add_argument("--profile-top", type=int, default=15, help="number of hot functions to print when profiling")
+    run.add_argument("--memory", action="store_true", help="report peak and retained memory of each part with tracemalloc")
+    run.add_argument("--memory-top", type=int, default=10, help="number of allocation sites to print")
+    run.add_argument("--variants", action="store_true", help="also run alternative implementations, e.g. numpy")
+
+    run_all = commands.add_parser("run-all", help="run all days of a year in parallel")
+    run_all.add_argument("year")
+    run_all.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    run_all.add_argument("--parts", type=parse_parts, default=(1, 2), help="comma separated, e.g. 1,2")
+    run_all.add_argument("--repeat", type=int, default=1, help="number of timed runs per part")
+    run_all.add_argument("--scale", type=float, help="use generated inputs, scaled relative to official inputs")
+    run_all.add_argument("--seed", type=int, default=0, help="seed of the generated inputs")
+    run_all.add_argument("--no-cache", action="store_true", help="always run the solvers, and don't store their answers")
+    run_all.add_argument("--cache-size", type=int, default=10, help="maximum size of the answer cache, in MB")
+
+    gen = commands.add_parser("generate", help="generate a scaled input for a day")
+    gen.add_argument("year")
+    gen.add_argument("day")
+    gen.add_argument("--scale", type=float, default=1, help="e.g. 10, 100, 1000")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("--kind", help="another kind of input, if the day has some, e.g. near-misses for 2024/03")
+    gen.add_argument("-o", "--output", type=Path, help="defaults to stdout")
+
+    bench = commands.add_parser("bench", help="benchmark solvers against their stored baselines")
+    bench.add_argument("year")
+    bench.add_argument("days", nargs="*", help="defaults to all days")
+    bench.add_argument("--scales", type=parse_scales, default=(1,), help="comma separated, e.g. 1,10")
+    bench.add_argument("--repeat", type=int, default=3)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--threshold", type=float, default=20, help="allowed slowdown in percent")
+    bench.add_argument("--min-time", type=float, default=0.01, help="ignore cases faster than this, in seconds")
+    bench.add_argument("--baseline", type=Path, help="defaults to benchmarks/YYYY.json")
+    bench.add_argument("--save", action="store_true", help="store the results as the new baseline")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        if args.input and len(args.days) > 1:
+            parser.error("--input can only be used with a single day")
+        cache = None if args.no_cache else AnswerCache(max_bytes=args.cache_size * 1024 * 1024)
+        days = [normalize_day(d) for d in args.days]
+        instrument = None
+        if args.profile and args.memory:
+            parser.error("--profile and --memory can't be used together")
+        elif args.profile:
+            instrument = partial(execute_profiled, top=args.profile_top)
+        elif args.memory:
+            instrument = partial(execute_traced, top=args.memory_top)
+        run_days(args.year, days, args.parts, args.repeat, args.input, args.scale, args.seed, cache,
+                 instrument=instrument, variants=args.variants)
+
+    elif args.command == "run-all":
+        cache = None if args.no_cache else AnswerCache(max_bytes=args.cache_size * 1024 * 1024)
+        days = sorted(solvers[args.year])
+        _, timing = measure(lambda: run_days(
+            args.year, days, args.parts, args.repeat, None, args.scale, args.seed, cache, args.workers
+        ))
+        print(f"{args.year}: {len(days)} days in {format_seconds(timing.wall[0])} with {args.workers} worker(s)")
+
+    elif args.command == "generate":
+        s = generate(args.year, normalize_day(args.day), args.scale, args.seed, args.kind)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(s)
+        else:
+            sys.stdout.write(s)
+
+    elif args.command == "bench":
+        days = [normalize_day(d) for d in args.days] or sorted(solvers[args.year])
+        path = args.baseline or baseline_path(args.year)
+        baseline = load_baseline(path)
+        failures = []
+
+        for day in days:
+            results = bench_day(args.year, day, args.scales, args.repeat, args.seed)
+            for l in format_results(day, baseline.get(day, {}), results):
+                print(l)
+            failures += compare(day, baseline.get(day, {}), results, args.threshold, args.min_time)
+            if args.save:
+                baseline[day] = results
+
+        if args.save:
+            save_baseline(path, baseline)
+            print(f"Baseline saved to {path}")
+        elif failures:
+            print(f"{len(failures)} regression(s):")
+            for f in failures:
+                print("    " + f)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from aoc.days import get_solvers, load_day, root
+from aoc.generators import generate, kinds
+from aoc.timing import Timing, format_seconds, measure
+
+
+# case name (e.g. "example", "x10 part 1+2") -> {"answers": [...], "wall": [min, median, max], "cpu": [...]}
+Results = Dict[str, Dict[str, list]]
+
+
+def baseline_path(year: str) -> Path:
+    return root / "benchmarks" / f"{year}.json"
+
+
+def summarize(timing: Timing, answers=None) -> Dict[str, list]:
+    result = {
+        "wall": list(timing.summary(timing.wall)),
+        "cpu": list(timing.summary(timing.cpu)),
+    }
+    if answers is not None:
+        result["answers"] = [str(a) for a in answers]
+    return result
+
+
+def bench_day(year: str, day: str, scales: Tuple[float, ...] = (1,), repeat=3, seed=0) -> Results:
+    module = load_day(year, day)
+    results: Results = {}
+
+    # Examples use day specific parameters, so they are benchmarked through example()
+    if hasattr(module, "example"):
+        _, timing = measure(module.example, repeat=repeat)
+        results["example"] = summarize(timing)
+
+    # Other kinds of inputs are benchmarked too, e.g. "x1 near-misses part 1"
+    for scale in scales:
+        for kind in [None] + kinds(year, day):
+            s = generate(year, day, scale, seed, kind)
+            case = f"x{scale:g} {kind}" if kind else f"x{scale:g}"
+            for solver in get_solvers(year, day, variants=True):
+                answers, timing = measure(lambda: solver.solve(module, s), repeat=repeat)
+                results[f"{case} part {solver.label}"] = summarize(timing, answers)
+
+    return results
+
+
+def load_baseline(path: Path) -> Dict[str, Results]:
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(path: Path, baseline: Dict[str, Results]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(day: str, baseline: Results, results: Results, threshold: float, min_time: float) -> List[str]:
+    failures = []
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        before = baseline[case]
+
+        if "answers" in before and before["answers"] != result["answers"]:
+            failures.append(f"{day} {case}: answers changed from {before['answers']} to {result['answers']}")
+
+        # Compare medians, and ignore anything too fast to be measured reliably
+        old, new = before["wall"][1], result["wall"][1]
+        if new < min_time:
+            continue
+        change = 100 * (new - old) / old
+        if change > threshold:
+            failures.append(
+                f"{day} {case}: {format_seconds(old)} -> {format_seconds(new)} ({change:+.0f}%)"
+            )
+    return failures
+
+
+def format_results(day: str, baseline: Results, results: Results) -> List[str]:
+    lines = []
+    for case, result in results.items():
+        new = result["wall"][1]
+        line = f"{day} {case:<18} {format_seconds(new):>9}"
+        if case in baseline:
+            old = baseline[case]["wall"][1]
+            line += f"  (baseline {format_seconds(old)}, {100 * (new - old) / old:+.0f}%)"
+        lines.append(line)
+    return lines
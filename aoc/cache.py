@@ -0,0 +1,115 @@
+import ast
+import hashlib
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Set
+
+from aoc.days import root
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def module_file(year_dir: Path, name: str) -> Optional[Path]:
+    # File of a module imported from the year directory (e.g. common.grid), None for any other module
+    path = year_dir.joinpath(*name.split("."))
+    for f in (path.with_suffix(".py"), path / "__init__.py"):
+        if f.is_file():
+            return f
+    return None
+
+
+def local_imports(year_dir: Path, path: Path) -> Set[Path]:
+    # Files from the year directory imported by a file, directly or not, along with the
+    # __init__.py of their packages. Imports are read from the source instead of sys.modules,
+    # which also holds the modules of other days loaded by the same process.
+    files: Set[Path] = set()
+    pending = [path]
+    while pending:
+        tree = ast.parse(pending.pop().read_bytes())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                parts = name.split(".")
+                for k in range(1, len(parts) + 1):
+                    f = module_file(year_dir, ".".join(parts[:k]))
+                    if f and f not in files:
+                        files.add(f)
+                        pending.append(f)
+    return files
+
+
+def source_hash(year: str, module: ModuleType) -> str:
+    # A day's answers depend on its own source, the shared modules it imports
+    # from its year directory, and the way it is called from aoc/days.py
+    year_dir = root / year
+    day_file = Path(module.__file__).resolve()
+    files = {root / "aoc" / "days.py", day_file} | local_imports(year_dir, day_file)
+
+    h = hashlib.sha256()
+    for f in sorted(files):
+        h.update(str(f.relative_to(root)).encode())
+        h.update(f.read_bytes())
+    return h.hexdigest()
+
+
+class AnswerCache:
+    # One JSON file per entry, the modification time of a file is its last use,
+    # and the least recently used entries are evicted when the cache gets too large
+    def __init__(self, directory: Path = root / ".cache" / "answers", max_bytes=10 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, year: str, day: str, label: str, input: str, source: str, repeat=1) -> str:
+        # Entries hold timings too, which are only reused for the same number of runs
+        return sha256("\0".join((year, day, label, sha256(input.encode()), source, str(repeat))).encode())
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self.path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        os.utime(path)
+        return entry
+
+    def put(self, key: str, entry: dict):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        tmp.replace(path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for p in self.directory.glob("*.json"):
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, p))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for p in self.directory.glob("*.json"):
+            p.unlink(missing_ok=True)
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+
+root = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class Solver:
+    # Some days compute both parts in a single call, those solvers cover parts (1, 2)
+    parts: Tuple[int, ...]
+    solve: Callable[[ModuleType, str], Any]
+    # Alternative implementations of the same parts (e.g. "numpy") are only run on demand
+    variant: str = ""
+
+    @property
+    def label(self):
+        label = "+".join(str(p) for p in self.parts)
+        return f"{label} ({self.variant})" if self.variant else label
+
+
+def single(fn: Callable[[ModuleType, str], Any]) -> Callable[[ModuleType, str], Any]:
+    return lambda m, s: (fn(m, s),)
+
+
+def memory_size(s: str) -> Dict[str, int]:
+    # Official inputs are always 71 * 71 with 1024 bytes for part 1, generated
+    # inputs can be larger, keep the same proportion of fallen bytes
+    w = max(int(n) for l in s.split() for n in l.split(",")) + 1
+    return {"w": w, "nanoseconds": 1024 * w * w // (71 * 71)}
+
+
+solvers: Dict[str, Dict[str, List[Solver]]] = {
+    "2024": {
+        "01": [
+            Solver((1,), single(lambda m, s: m.distance(*m.parse_lists(s)))),
+            Solver((2,), single(lambda m, s: m.similarity(*m.parse_lists(s)))),
+            Solver((1,), single(lambda m, s: m.distance_vectorized(*m.parse_arrays(s))), "numpy"),
+            Solver((2,), single(lambda m, s: m.similarity_vectorized(*m.parse_arrays(s))), "numpy"),
+            Solver((1,), single(lambda m, s: m.distance_external(s)), "external"),
+            Solver((2,), single(lambda m, s: m.similarity_streaming(s)), "external"),
+        ],
+        "02": [
+            Solver((1,), single(lambda m, s: sum(m.is_safe(r) for r in m.parse_reports(s)))),
+            Solver((2,), single(lambda m, s: sum(m.is_safe_dampened(r) for r in m.parse_reports(s)))),
+            Solver((1,), single(lambda m, s: m.count_safe_batched(s)), "numpy"),
+            Solver((2,), single(lambda m, s: m.count_safe_batched(s, dampened=True)), "numpy"),
+        ],
+        "03": [
+            Solver((1,), single(lambda m, s: sum(a * b for a, b in m.read_memory(s)))),
+            Solver((2,), single(lambda m, s: sum(a * b for a, b in m.read_memory_v2(s)))),
+            Solver((1,), single(lambda m, s: sum(a * b for a, b in m.read_memory_stream(m.chunked(s, 1 << 16), False))), "stream"),
+            Solver((2,), single(lambda m, s: sum(a * b for a, b in m.read_memory_stream(m.chunked(s, 1 << 16)))), "stream"),
+            Solver((1,), single(lambda m, s: m.read_memory_parallel(s, conditional=False)), "parallel"),
+            Solver((2,), single(lambda m, s: m.read_memory_parallel(s)), "parallel"),
+            # Only part 2: the part 1 regex has no alternation and the tokenizer merely ties with it
+            Solver((2,), single(lambda m, s: sum(a * b for a, b in m.read_memory_bytes(s))), "tokenizer"),
+        ],
+        "04": [
+            Solver((1,), single(lambda m, s: m.process_grid(s))),
+            Solver((2,), single(lambda m, s: m.find_crosses(s))),
+            Solver((2,), single(lambda m, s: m.count_crosses(m.Grid.parse(s))), "numpy"),
+        ],
+        "05": [
+            Solver((1,), single(lambda m, s: m.process_input(s))),
+            Solver((2,), single(lambda m, s: m.process_input_incorrect(s))),
+        ],
+        "06": [
+            Solver((1,), single(lambda m, s: len(m.navigate_map(s)))),
+            Solver((2,), single(lambda m, s: m.find_loops(s))),
+        ],
+        "07": [
+            Solver((1,), single(lambda m, s: m.process_equations(s))),
+            Solver((2,), single(lambda m, s: m.process_equations(s, operators=m.operators_v2))),
+        ],
+        "08": [
+            Solver((1,), single(lambda m, s: m.count_antinodes(s))),
+            Solver((2,), single(lambda m, s: m.count_antinodes(s, resonnant=True))),
+        ],
+        "09": [Solver((1, 2), lambda m, s: m.process(s))],
+        "10": [Solver((1, 2), lambda m, s: m.process(s))],
+        "11": [
+            Solver((1,), single(lambda m, s: m.process(s, 25))),
+            Solver((2,), single(lambda m, s: m.process(s, 75))),
+        ],
+        "12": [
+            Solver((1,), single(lambda m, s: m.cost(s))),
+            Solver((2,), single(lambda m, s: m.cost(s, bulk=True))),
+        ],
+        "13": [
+            Solver((1,), single(lambda m, s: m.process_machines(s))),
+            Solver((2,), single(lambda m, s: m.process_machines(s, increase=True))),
+        ],
+        # Part 2 is found by watching the robots, see 14.py
+        "14": [Solver((1,), single(lambda m, s: m.simulate_floor(s)))],
+        "15": [
+            Solver((1,), single(lambda m, s: m.process(s))),
+            Solver((2,), single(lambda m, s: m.process(s, wide=True))),
+        ],
+        "16": [Solver((1, 2), lambda m, s: m.lowest_score(s))],
+        "17": [
+            Solver((1,), single(lambda m, s: m.execute_program(s))),
+            Solver((2,), single(lambda m, s: m.find_quine_re(s))),
+        ],
+        "18": [Solver((1, 2), lambda m, s: m.process(s, **memory_size(s)))],
+        "19": [Solver((1, 2), lambda m, s: m.process(s))],
+        "20": [Solver((1, 2), lambda m, s: m.count_shortcuts(s))],
+        "21": [
+            Solver((1,), single(lambda m, s: m.input_all_codes(s, depth=3))),
+            Solver((2,), single(lambda m, s: m.input_all_codes(s, depth=26))),
+        ],
+        "22": [
+            Solver((1,), single(lambda m, s: m.add_secrets(s))),
+            Solver((2,), single(lambda m, s: m.buy_bananas(s))),
+        ],
+        "23": [
+            Solver((1,), single(lambda m, s: m.count_interconnected(s))),
+            Solver((2,), single(lambda m, s: m.largest_interconnected(s))),
+        ],
+        # Part 2 was solved by visually inspecting the circuit, see 24.py
+        "24": [Solver((1,), single(lambda m, s: m.run_circuit(s)))],
+        "25": [Solver((1,), single(lambda m, s: m.count_fitting_keys(s)))],
+    }
+}
+
+
+def day_path(year: str, day: str) -> Path:
+    return root / year / f"{day}.py"
+
+
+def input_path(year: str, day: str) -> Path:
+    return root / year / f"{day}.input"
+
+
+def load_day(year: str, day: str) -> ModuleType:
+    # Day modules are plain scripts named after their day (e.g. 2024/06.py), which
+    # are not valid module names, so they are loaded from their file path
+    year_dir = str(root / year)
+    if year_dir not in sys.path:
+        sys.path.insert(0, year_dir)
+
+    name = f"aoc_{year}_{day}"
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, day_path(year, day))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_input(year: str, day: str, path: Path = None) -> str:
+    with open(path or input_path(year, day), "r") as f:
+        return f.read()
+
+
+def normalize_day(day: str) -> str:
+    return day.rjust(2, "0")
+
+
+def get_solvers(year: str, day: str, parts: Tuple[int, ...] = (1, 2), variants=False) -> List[Solver]:
+    if year not in solvers or day not in solvers[year]:
+        raise KeyError(f"No solvers registered for {year}/{day}")
+    return [
+        s for s in solvers[year][day]
+        if any(p in parts for p in s.parts) and (variants or not s.variant)
+    ]
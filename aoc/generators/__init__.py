@@ -0,0 +1,18 @@
+import importlib
+from random import Random
+from typing import List
+
+
+def generate(year: str, day: str, scale: float = 1, seed: int = 0, kind: str = None) -> str:
+    # Each day has a generator module aoc/generators/yYYYY/dayDD.py exposing
+    # generate(rng, scale), where scale is relative to the size of an official input.
+    # Some days also have other kinds of inputs, e.g. adversarial ones, in a dict `kinds`
+    # of generators with the same signature.
+    module = importlib.import_module(f"aoc.generators.y{year}.day{day}")
+    generator = module.kinds[kind] if kind else module.generate
+    return generator(Random(seed), scale)
+
+
+def kinds(year: str, day: str) -> List[str]:
+    module = importlib.import_module(f"aoc.generators.y{year}.day{day}")
+    return list(getattr(module, "kinds", {}))
@@ -0,0 +1,43 @@
+from math import sqrt
+from random import Random
+from typing import List, Tuple
+
+
+def scaled(n: int, scale: float) -> int:
+    return max(1, round(n * scale))
+
+
+def scaled_side(side: int, scale: float) -> int:
+    # Scale the side of a square grid so that its area is scaled by `scale`
+    return max(1, round(side * sqrt(scale)))
+
+
+def odd(n: int) -> int:
+    return n if n % 2 == 1 else n + 1
+
+
+def carve_maze(rng: Random, w: int, h: int) -> List[List[str]]:
+    # Randomized depth-first maze on the odd coordinates of a w * h grid (w and h odd),
+    # walls everywhere else. The result is a tree: exactly one path between two cells.
+    grid = [["#"] * w for _ in range(h)]
+    grid[1][1] = "."
+    stack: List[Tuple[int, int]] = [(1, 1)]
+    while stack:
+        x, y = stack[-1]
+        candidates = [
+            (x + dx, y + dy, x + dx // 2, y + dy // 2)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < w - 1 and 0 < y + dy < h - 1 and grid[y + dy][x + dx] == "#"
+        ]
+        if not candidates:
+            stack.pop()
+            continue
+        nx, ny, wx, wy = rng.choice(candidates)
+        grid[wy][wx] = "."
+        grid[ny][nx] = "."
+        stack.append((nx, ny))
+    return grid
+
+
+def join_grid(grid: List[List[str]]) -> str:
+    return "\n".join("".join(l) for l in grid) + "\n"
@@ -0,0 +1,11 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    n = scaled(1000, scale)
+    # Official lists are 5 digit location IDs, about one left ID in 10 appears in the right list
+    left = [rng.randint(10000, 99999) for _ in range(n)]
+    right = [rng.choice(left) if rng.random() < 0.1 else rng.randint(10000, 99999) for _ in range(n)]
+    return "".join(f"{a}   {b}\n" for a, b in zip(left, right))
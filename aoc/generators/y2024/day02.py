@@ -0,0 +1,26 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        length = rng.randint(5, 8)
+        sign = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        report = [level]
+        for _ in range(length - 1):
+            # Mostly safe steps, with the occasional flat, reversed or too large step
+            step = sign * rng.randint(1, 3)
+            r = rng.random()
+            if r < 0.05:
+                step = 0
+            elif r < 0.1:
+                step = -step
+            elif r < 0.15:
+                step = sign * rng.randint(4, 7)
+            level = max(1, level + step)
+            report.append(level)
+        lines.append(" ".join(str(n) for n in report))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,42 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+noise = "!@#$%^&*()[]{}<>,;:'?+-_/ selectwhymulfromdonhow"
+
+
+def generate(rng: Random, scale: float) -> str:
+    parts = []
+    for _ in range(scaled(1200, scale)):
+        r = rng.random()
+        if r < 0.6:
+            parts.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        elif r < 0.7:
+            parts.append("do()")
+        elif r < 0.8:
+            parts.append("don't()")
+        else:
+            # Near misses, which must not be matched
+            parts.append(rng.choice([
+                f"mul({rng.randint(1, 999)},{rng.randint(1, 999)}]",
+                f"mul[{rng.randint(1, 999)},{rng.randint(1, 999)})",
+                f"mul ({rng.randint(1, 999)},{rng.randint(1, 999)})",
+                f"mul({rng.randint(1000, 9999)},{rng.randint(1, 999)})",
+                "do_not()",
+            ]))
+        parts.append("".join(rng.choice(noise) for _ in range(rng.randint(0, 10))))
+    return "".join(parts) + "\n"
+
+
+def generate_near_misses(rng: Random, scale: float) -> str:
+    # Adversarial input for scanners: almost every position starts an instruction that is never completed
+    prefixes = ["mul(", "mul(1", "mul(12,", "mul(123,45", "mul(1,2]", "mul(1234,5)", "do(", "don't(", "mul ("]
+    parts = [rng.choice(prefixes) for _ in range(scaled(2500, scale))]
+    # A few complete instructions, so there is something to add up
+    for _ in range(scaled(25, scale)):
+        parts[rng.randrange(len(parts))] = rng.choice([f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})", "do()", "don't()"])
+    return "".join(parts) + "\n"
+
+
+kinds = {"near-misses": generate_near_misses}
@@ -0,0 +1,8 @@
+from random import Random
+
+from aoc.generators.common import scaled_side
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    return "".join("".join(rng.choice("XMAS") for _ in range(side)) + "\n" for _ in range(side))
@@ -0,0 +1,29 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    # Official inputs have 49 pages with a rule for every pair of pages,
+    # scaling the number of pages by sqrt(scale) scales the number of rules by scale
+    n_pages = max(5, round(49 * scale ** 0.5))
+    pages = rng.sample(range(10, 10 + 2 * n_pages), n_pages)
+    rank = {p: i for i, p in enumerate(pages)}
+
+    rules = [(a, b) for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(scaled(200, scale)):
+        length = rng.randrange(5, min(24, n_pages + 1), 2) if n_pages > 5 else 5
+        update = rng.sample(pages, length)
+        if rng.random() < 0.5:
+            update.sort(key=lambda p: rank[p])
+        updates.append(update)
+
+    return (
+        "\n".join(f"{a}|{b}" for a, b in rules)
+        + "\n\n"
+        + "\n".join(",".join(str(p) for p in u) for u in updates)
+        + "\n"
+    )
@@ -0,0 +1,44 @@
+from random import Random
+from typing import List
+
+from aoc.generators.common import join_grid, scaled_side
+
+
+def walk(grid: List[List[str]], x: int, y: int) -> int:
+    # Number of distinct steps before the guard leaves the map, 0 if it never does
+    h, w = len(grid), len(grid[0])
+    dx, dy = 0, -1
+    seen = set()
+    while True:
+        if (x, y, dx, dy) in seen:
+            return 0
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < w and 0 <= ny < h):
+            return len(seen)
+        if grid[ny][nx] == "#":
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(130, scale)
+    grid = [["#" if rng.random() < 0.03 else "." for _ in range(side)] for _ in range(side)]
+
+    # Random maps usually let the guard escape quickly, or trap it in a loop.
+    # Official maps have long walks, so keep the start with the longest walk.
+    best, start = -1, None
+    for _ in range(50):
+        x, y = rng.randrange(side), rng.randrange(side)
+        if grid[y][x] != ".":
+            continue
+        length = walk(grid, x, y)
+        if length > best:
+            best, start = length, (x, y)
+    if best <= 0:
+        return generate(rng, scale)
+
+    x, y = start
+    grid[y][x] = "^"
+    return join_grid(grid)
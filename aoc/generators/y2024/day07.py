@@ -0,0 +1,17 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(850, scale)):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        result = operands[0]
+        for n in operands[1:]:
+            result = rng.choice((result + n, result * n, int(f"{result}{n}")))
+        # About half of the equations can't be solved
+        if rng.random() < 0.5:
+            result += rng.randint(1, 9)
+        lines.append(f"{result}: " + " ".join(str(n) for n in operands))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,16 @@
+from random import Random
+import string
+
+from aoc.generators.common import join_grid, scaled_side
+
+
+frequencies = string.ascii_letters + string.digits
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+    # About 4 antennas per frequency, and one antenna per 13 cells
+    for _ in range(side * side // 13):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return join_grid(grid)
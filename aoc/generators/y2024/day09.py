@@ -0,0 +1,11 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    n = scaled(10000, scale)
+    digits = []
+    for i in range(2 * n - 1):
+        digits.append(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)))
+    return "".join(digits) + "\n"
@@ -0,0 +1,31 @@
+from random import Random
+
+from aoc.generators.common import join_grid, scaled_side
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(50, scale)
+    grid = [[str(rng.randint(0, 9)) for _ in range(side)] for _ in range(side)]
+    used = set()
+
+    # Draw hiking trails from 0 to 9 over the noise, without crossing previous trails
+    for _ in range(side * side // 30):
+        x, y = rng.randrange(side), rng.randrange(side)
+        trail = [(x, y)]
+        while len(trail) < 10:
+            x, y = trail[-1]
+            candidates = [
+                (nx, ny)
+                for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+                if 0 <= nx < side and 0 <= ny < side and (nx, ny) not in used and (nx, ny) not in trail
+            ]
+            if not candidates:
+                break
+            trail.append(rng.choice(candidates))
+        if len(trail) < 10 or trail[0] in used:
+            continue
+        for height, (x, y) in enumerate(trail):
+            grid[y][x] = str(height)
+            used.add((x, y))
+
+    return join_grid(grid)
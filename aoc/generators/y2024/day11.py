@@ -0,0 +1,8 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    stones = [rng.randint(0, 9_999_999) for _ in range(scaled(8, scale))]
+    return " ".join(str(n) for n in stones) + "\n"
@@ -0,0 +1,22 @@
+from random import Random
+import string
+
+from aoc.generators.common import join_grid, scaled_side
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    # Coarse blocks of plants with some noise, so that regions have irregular shapes
+    block = 6
+    coarse = [
+        [rng.choice(string.ascii_uppercase) for _ in range(side // block + 1)]
+        for _ in range(side // block + 1)
+    ]
+    grid = [
+        [
+            rng.choice(string.ascii_uppercase) if rng.random() < 0.1 else coarse[y // block][x // block]
+            for x in range(side)
+        ]
+        for y in range(side)
+    ]
+    return join_grid(grid)
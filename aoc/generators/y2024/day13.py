@@ -0,0 +1,20 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    machines = []
+    for _ in range(scaled(320, scale)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            na, nb = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = na * ax + nb * bx, na * ay + nb * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={px}, Y={py}\n"
+        )
+    return "\n".join(machines)
@@ -0,0 +1,11 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    # The floor size is fixed by the solver (101 * 103), only the number of robots scales
+    return "".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}\n"
+        for _ in range(scaled(500, scale))
+    )
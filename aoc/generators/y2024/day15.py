@@ -0,0 +1,19 @@
+from random import Random
+
+from aoc.generators.common import join_grid, scaled, scaled_side
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = scaled_side(50, scale)
+    grid = [["#"] * side for _ in range(side)]
+    for y in range(1, side - 1):
+        for x in range(1, side - 1):
+            r = rng.random()
+            grid[y][x] = "#" if r < 0.05 else "O" if r < 0.45 else "."
+    x, y = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+    grid[y][x] = "@"
+
+    moves = "".join(rng.choice("<>^v") for _ in range(scaled(20000, scale)))
+    lines = [moves[i:i + 1000] for i in range(0, len(moves), 1000)]
+
+    return join_grid(grid) + "\n" + "\n".join(lines) + "\n"
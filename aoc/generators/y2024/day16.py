@@ -0,0 +1,18 @@
+from random import Random
+
+from aoc.generators.common import carve_maze, join_grid, odd, scaled_side
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = odd(scaled_side(141, scale))
+    grid = carve_maze(rng, side, side)
+
+    # Knock down some extra walls so that there are several paths of equal cost
+    for _ in range(side * side // 50):
+        x, y = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (x + y) % 2 == 1:
+            grid[y][x] = "."
+
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return join_grid(grid)
@@ -0,0 +1,18 @@
+from random import Random
+
+
+# Same structure as the official program, which 17.py decompiles in run_re
+program = "2,4,1,1,7,5,0,3,4,3,1,6,5,5,3,0"
+
+
+def generate(rng: Random, scale: float) -> str:
+    # The program can't grow, but a larger register A outputs more digits (3 bits each)
+    bits = max(3, round(48 * scale))
+    a = rng.getrandbits(bits) | (1 << (bits - 1))
+    return (
+        f"Register A: {a}\n"
+        "Register B: 0\n"
+        "Register C: 0\n"
+        "\n"
+        f"Program: {program}\n"
+    )
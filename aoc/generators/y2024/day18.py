@@ -0,0 +1,34 @@
+from random import Random
+
+from aoc.generators.common import scaled_side
+
+
+def generate(rng: Random, scale: float) -> str:
+    # The solver deduces the memory size from the largest coordinate,
+    # and the number of bytes of part 1 from the memory size (1024 for 71 * 71)
+    w = scaled_side(71, scale)
+    part1_bytes = 1024 * w * w // (71 * 71)
+
+    # Keep a random staircase path free while the bytes of part 1 fall,
+    # so that the exit is still reachable for part 1
+    x, y = 0, 0
+    path = {(x, y)}
+    while (x, y) != (w - 1, w - 1):
+        if y == w - 1 or (x < w - 1 and rng.random() < 0.5):
+            x += 1
+        else:
+            y += 1
+        path.add((x, y))
+
+    cells = [(x, y) for y in range(w) for x in range(w) if (x, y) not in path]
+    rng.shuffle(cells)
+    first, rest = cells[:part1_bytes], cells[part1_bytes:]
+    rest += [p for p in path if p not in ((0, 0), (w - 1, w - 1))]
+    rng.shuffle(rest)
+
+    # Official inputs drop bytes on about two thirds of the memory
+    cells = (first + rest)[:max(part1_bytes + 1, w * w * 2 // 3)]
+    # Make sure the largest coordinate is present
+    if all(x != w - 1 and y != w - 1 for x, y in cells):
+        cells.append((w - 1, 0))
+    return "".join(f"{x},{y}\n" for x, y in cells)
@@ -0,0 +1,25 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+colors = "wubrg"
+
+
+def generate(rng: Random, scale: float) -> str:
+    patterns = sorted({
+        "".join(rng.choice(colors) for _ in range(rng.randint(1, 8)))
+        for _ in range(447)
+    })
+
+    designs = []
+    for _ in range(scaled(400, scale)):
+        if rng.random() < 0.7:
+            design = ""
+            while len(design) < 40:
+                design += rng.choice(patterns)
+        else:
+            design = "".join(rng.choice(colors) for _ in range(rng.randint(40, 60)))
+        designs.append(design)
+
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs) + "\n"
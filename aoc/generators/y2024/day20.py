@@ -0,0 +1,31 @@
+from random import Random
+from typing import Dict, Tuple
+
+from aoc.generators.common import carve_maze, join_grid, odd, scaled_side
+
+
+def generate(rng: Random, scale: float) -> str:
+    side = odd(scaled_side(141, scale))
+    maze = carve_maze(rng, side, side)
+
+    # The racetrack is the only path between two corners of the maze,
+    # found by walking back the parents of a flood fill
+    start, end = (1, side - 2), (side - 2, 1)
+    parents: Dict[Tuple[int, int], Tuple[int, int]] = {start: start}
+    queue = [start]
+    while queue:
+        x, y = queue.pop()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if maze[ny][nx] == "." and (nx, ny) not in parents:
+                parents[(nx, ny)] = (x, y)
+                queue.append((nx, ny))
+
+    grid = [["#"] * side for _ in range(side)]
+    pos = end
+    while pos != start:
+        grid[pos[1]][pos[0]] = "."
+        pos = parents[pos]
+    grid[start[1]][start[0]] = "S"
+    grid[end[1]][end[0]] = "E"
+
+    return join_grid(grid)
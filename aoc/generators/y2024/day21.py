@@ -0,0 +1,7 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    return "".join(f"{rng.randint(0, 999):03d}A\n" for _ in range(scaled(5, scale)))
@@ -0,0 +1,7 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    return "".join(f"{rng.randrange(1 << 24)}\n" for _ in range(scaled(1600, scale)))
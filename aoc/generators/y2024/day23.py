@@ -0,0 +1,29 @@
+from itertools import combinations, product
+from random import Random
+import string
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    n = scaled(520, scale)
+    # Two letter names like the official input, longer names when there are too many computers
+    letters = 2
+    while 26 ** letters < n:
+        letters += 1
+    names = ["".join(p) for p in product(string.ascii_lowercase, repeat=letters)]
+    names = rng.sample(names, n)
+
+    links = set()
+    for a in names:
+        for b in rng.sample(names, 6):
+            if a != b:
+                links.add(tuple(sorted((a, b))))
+
+    # Plant one large LAN party
+    for a, b in combinations(rng.sample(names, min(n, 13)), 2):
+        links.add(tuple(sorted((a, b))))
+
+    links = list(links)
+    rng.shuffle(links)
+    return "".join(f"{a}-{b}\n" for a, b in links)
@@ -0,0 +1,42 @@
+from random import Random
+import string
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    # A ripple carry adder of full adders, like the official (untwisted) circuit
+    bits = min(99, scaled(45, scale))
+    names = set()
+
+    def name():
+        while True:
+            n = "".join(rng.choice(string.ascii_lowercase) for _ in range(3))
+            if n not in names and n[0] not in "xyz":
+                names.add(n)
+                return n
+
+    def w(prefix, i):
+        return f"{prefix}{i:02d}"
+
+    gates = []
+    carry = None
+    for i in range(bits):
+        x, y, z = w("x", i), w("y", i), w("z", i)
+        if carry is None:
+            gates.append((x, "XOR", y, z))
+            carry = name()
+            gates.append((x, "AND", y, carry))
+            continue
+        half_sum, half_carry, carry_and, new_carry = name(), name(), name(), name()
+        gates.append((x, "XOR", y, half_sum))
+        gates.append((half_sum, "XOR", carry, z))
+        gates.append((x, "AND", y, half_carry))
+        gates.append((half_sum, "AND", carry, carry_and))
+        gates.append((half_carry, "OR", carry_and, new_carry))
+        carry = new_carry
+    gates[-1] = gates[-1][:3] + (w("z", bits),)
+
+    rng.shuffle(gates)
+    signals = [f"{w(p, i)}: {rng.randint(0, 1)}" for p in "xy" for i in range(bits)]
+    return "\n".join(signals) + "\n\n" + "\n".join(f"{a} {g} {b} -> {c}" for a, g, b, c in gates) + "\n"
@@ -0,0 +1,17 @@
+from random import Random
+
+from aoc.generators.common import scaled
+
+
+def generate(rng: Random, scale: float) -> str:
+    schematics = []
+    for i in range(scaled(500, scale)):
+        is_lock = i % 2 == 0
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = []
+        for row in range(1, 6):
+            level = row if is_lock else 6 - row
+            rows.append("".join("#" if h >= level else "." for h in heights))
+        top, bottom = ("#####", ".....") if is_lock else (".....", "#####")
+        schematics.append("\n".join([top] + rows + [bottom]))
+    return "\n\n".join(schematics) + "\n"
@@ -0,0 +1,75 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+import threading
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+from aoc.days import root
+
+
+@dataclass
+class MemoryReport:
+    # Bytes allocated at the peak, and still allocated once the solver returned
+    peak: int
+    retained: int
+    peak_sites: List[str] = field(default_factory=list)
+    retained_sites: List[str] = field(default_factory=list)
+
+
+def format_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.2f}GB"
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, top: int) -> List[str]:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+    lines = []
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        filename = frame.filename
+        if filename.startswith(str(root)):
+            filename = str(Path(filename).relative_to(root))
+        lines.append(f"{format_bytes(stat.size):>9} {stat.count:>9}  {filename}:{frame.lineno}")
+    return lines
+
+
+def trace_memory(fn: Callable[[], Any], top=10, interval=0.05) -> Tuple[Any, MemoryReport]:
+    # tracemalloc knows the size of the peak but not where it was allocated, so snapshots are
+    # sampled from another thread while fn runs, and the largest one stands for the peak
+    largest: List[Optional[tracemalloc.Snapshot]] = [None]
+    largest_size = [0]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(interval):
+            size = tracemalloc.get_traced_memory()[0]
+            if size > largest_size[0]:
+                largest[0] = tracemalloc.take_snapshot()
+                largest_size[0] = size
+
+    tracemalloc.start()
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = fn()
+    finally:
+        done.set()
+        sampler.join()
+        retained, peak = tracemalloc.get_traced_memory()
+        retained_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    report = MemoryReport(
+        peak=peak,
+        retained=retained,
+        peak_sites=top_sites(largest[0], top) if largest[0] else [],
+        retained_sites=top_sites(retained_snapshot, top),
+    )
+    return result, report
@@ -0,0 +1,81 @@
+import cProfile
+from pathlib import Path
+import pstats
+from typing import Any, Callable, Dict, List, Tuple
+
+from aoc.days import root
+
+
+# (file, line, function name), as used as keys by pstats
+Function = Tuple[str, int, str]
+
+
+def profile(fn: Callable[[], Any]) -> Tuple[Any, pstats.Stats]:
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn)
+    return result, pstats.Stats(profiler)
+
+
+def function_name(f: Function) -> str:
+    file, line, name = f
+    if file == "~":
+        # Builtins, e.g. "<built-in method builtins.sum>"
+        return name.strip("<>")
+    return f"{Path(file).name}:{name}"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    # cProfile only records caller -> callee edges, not full stacks. Stacks are rebuilt by
+    # walking the call graph from the roots, splitting the time of a function between its
+    # callers proportionally to the time spent under each of them. Values are microseconds.
+    raw = stats.stats
+    callees: Dict[Function, Dict[Function, Tuple]] = {f: {} for f in raw}
+    for f, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            if caller in callees:
+                callees[caller][f] = edge
+
+    stacks: Dict[str, int] = {}
+
+    def walk(f: Function, stack: List[str], self_time: float, total_time: float):
+        stack = stack + [function_name(f)]
+        key = ";".join(stack)
+        stacks[key] = stacks.get(key, 0) + round(self_time * 1e6)
+
+        # Fraction of this function's total time that was spent on this stack
+        f_total = raw[f][3]
+        ratio = total_time / f_total if f_total else 0
+        for callee, (_, _, tt, ct) in callees[f].items():
+            if function_name(callee) in stack[:-1] or callee == f:
+                continue
+            walk(callee, stack, tt * ratio, ct * ratio)
+
+    for f, (_, _, tt, ct, callers) in raw.items():
+        if not callers:
+            walk(f, [], tt, ct)
+
+    return {k: v for k, v in stacks.items() if v > 0}
+
+
+def write_profile(stats: pstats.Stats, name: str, directory: Path = root / "profiles") -> Tuple[Path, Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    pstats_path = directory / f"{name}.pstats"
+    collapsed_path = directory / f"{name}.collapsed.txt"
+
+    stats.dump_stats(pstats_path)
+    # One "frame;frame;frame value" line per stack, as expected by flamegraph.pl, speedscope or inferno
+    with open(collapsed_path, "w") as f:
+        for stack, value in sorted(collapsed_stacks(stats).items()):
+            f.write(f"{stack} {value}\n")
+
+    return pstats_path, collapsed_path
+
+
+def hot_functions(stats: pstats.Stats, top=10) -> List[str]:
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    total = sum(tt for _, (_, _, tt, _, _) in stats.stats.items()) or 1
+    lines = [f"{'self':>9} {'%':>5} {'cumulative':>10} {'calls':>10}  function"]
+    for f, (_, nc, tt, ct, _) in rows:
+        location = "" if f[0] == "~" else f":{f[1]}"
+        lines.append(f"{tt:9.4f} {100 * tt / total:5.1f} {ct:10.4f} {nc:10d}  {function_name(f)}{location}")
+    return lines
@@ -0,0 +1,172 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+import re
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from aoc.cache import AnswerCache, source_hash
+from aoc.days import get_solvers, input_path, load_day, read_input, root, solvers
+from aoc.generators import generate
+from aoc.memory import format_bytes, trace_memory
+from aoc.profiling import hot_functions, profile, write_profile
+from aoc.timing import Timing, format_timing, measure
+
+
+@dataclass(frozen=True)
+class Task:
+    year: str
+    day: str
+    # "example", or the label of a solver, e.g. "1", "1+2" or "1 (numpy)"
+    label: str
+    parts: Tuple[int, ...] = ()
+    variant: str = ""
+
+
+def execute(task: Task, s: str, repeat: int) -> Tuple[Tuple[Any, ...], Timing]:
+    # Runs in worker processes, so it only takes picklable arguments and looks up the solver itself
+    module = load_day(task.year, task.day)
+    if task.label == "example":
+        _, timing = measure(module.example)
+        return (), timing
+    solver = next(solver for solver in solvers[task.year][task.day] if solver.label == task.label)
+    return measure(lambda: solver.solve(module, s), repeat=repeat)
+
+
+# Instruments wrap the execution of a task to report more than its timing,
+# e.g. partial(execute_profiled, top=15)
+Instrument = Callable[[Task, str], Tuple[Tuple[Any, ...], Timing]]
+
+
+def execute_profiled(task: Task, s: str, top: int) -> Tuple[Tuple[Any, ...], Timing]:
+    # Timings include the overhead of the profiler
+    (answers, timing), stats = profile(lambda: execute(task, s, 1))
+    label = "_".join(re.findall(r"\w+", task.label))
+    name = f"{task.year}-{task.day}-part{label}-{time.strftime('%Y%m%d-%H%M%S')}"
+    pstats_path, collapsed_path = write_profile(stats, name)
+
+    print(f"{task.year}/{task.day} part {task.label} profile:")
+    print(f"    {pstats_path.relative_to(root)}, {collapsed_path.relative_to(root)}")
+    for l in hot_functions(stats, top):
+        print("    " + l)
+    return answers, timing
+
+
+def execute_traced(task: Task, s: str, top: int) -> Tuple[Tuple[Any, ...], Timing]:
+    # Timings include the overhead of tracemalloc
+    (answers, timing), report = trace_memory(lambda: execute(task, s, 1), top)
+
+    print(f"{task.year}/{task.day} part {task.label} memory:")
+    print(f"    peak {format_bytes(report.peak)}, retained {format_bytes(report.retained)}")
+    for title, sites in (("at peak (sampled)", report.peak_sites), ("retained", report.retained_sites)):
+        if sites:
+            print(f"    top allocation sites {title}:")
+            for l in sites:
+                print("    " + l)
+    return answers, timing
+
+
+def print_timing(timing: Timing, indent="    "):
+    for l in format_timing(timing):
+        print(indent + l)
+
+
+def report(task: Task, parts: Tuple[int, ...], answers: Tuple[Any, ...], timing: Timing, cached: bool):
+    prefix = f"{task.year}/{task.day}"
+    if task.label == "example":
+        print(f"{prefix} example: ok{' (cached)' if cached else ''}")
+        print_timing(timing)
+        return
+
+    variant = f" ({task.variant})" if task.variant else ""
+    for part, answer in zip(task.parts, answers):
+        if part in parts:
+            print(f"{prefix} part {part}{variant}: {answer}")
+    print(f"    timing of part {task.label} over {len(timing.wall)} run(s){', cached' if cached else ''}:")
+    print_timing(timing)
+
+
+def load_input(year: str, day: str, input: Path = None, scale: float = None, seed=0) -> Tuple[Optional[str], str]:
+    if scale is not None:
+        s = generate(year, day, scale, seed)
+        return s, f"{year}/{day} generated input: scale {scale:g}, seed {seed}, {len(s)} bytes"
+    path = input or input_path(year, day)
+    if not path.exists():
+        return None, f"{year}/{day}: missing input {path}"
+    return read_input(year, day, path), ""
+
+
+def run_days(
+    year: str,
+    days: List[str],
+    parts: Tuple[int, ...] = (1, 2),
+    repeat=1,
+    input: Path = None,
+    scale: float = None,
+    seed=0,
+    cache: AnswerCache = None,
+    workers: int = None,
+    instrument: Instrument = None,
+    variants=False,
+):
+    # Every task is either answered from the cache, submitted to the pool, or deferred
+    # until it is reported when running sequentially. Reporting happens in submission
+    # order, so the output doesn't depend on which worker finishes first.
+    # Instrumented tasks always run sequentially and ignore the cache.
+    if instrument:
+        cache, workers = None, None
+    pool: Optional[Executor] = ProcessPoolExecutor(workers) if workers else None
+    # (task, cache key, cached entry, result getter, message printed before the task)
+    jobs: List[Tuple[Task, Optional[str], Optional[dict], Optional[Callable], str]] = []
+
+    for day in days:
+        module = load_day(year, day)
+        source = source_hash(year, module) if cache else None
+
+        tasks = [Task(year, day, "example")] if hasattr(module, "example") else []
+        s, message = load_input(year, day, input, scale, seed)
+        if s is not None:
+            tasks += [
+                Task(year, day, solver.label, solver.parts, solver.variant)
+                for solver in get_solvers(year, day, parts, variants)
+            ]
+
+        for i, task in enumerate(tasks):
+            before = message if task.label != "example" and (i == 0 or tasks[i - 1].label == "example") else ""
+            task_input = "" if task.label == "example" else s
+            task_repeat = 1 if task.label == "example" else repeat
+            key = cache.key(year, day, task.label, task_input, source, task_repeat) if cache else None
+            entry = cache.get(key) if cache else None
+            if entry:
+                jobs.append((task, key, entry, None, before))
+            elif instrument and task.label != "example":
+                jobs.append((task, key, None, partial(instrument, task, task_input), before))
+            elif pool:
+                jobs.append((task, key, None, pool.submit(execute, task, task_input, repeat).result, before))
+            else:
+                jobs.append((task, key, None, partial(execute, task, task_input, repeat), before))
+
+        if s is None:
+            jobs.append((None, None, None, None, message))
+
+    try:
+        for task, key, entry, result, before in jobs:
+            if before:
+                print(before)
+            if task is None:
+                continue
+            if entry:
+                answers, timing = entry.get("answers", ()), Timing(**entry["timing"])
+            else:
+                answers, timing = result()
+                if cache:
+                    cache.put(key, {"answers": [str(a) for a in answers], "timing": timing.__dict__})
+            report(task, parts, answers, timing, cached=entry is not None)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def run_day(year: str, day: str, *args, **kwargs):
+    run_days(year, [day], *args, **kwargs)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from statistics import median
+import time
+from typing import Any, Callable, List, Tuple
+
+
+@dataclass
+class Timing:
+    wall: List[float] = field(default_factory=list)
+    cpu: List[float] = field(default_factory=list)
+
+    def summary(self, samples: List[float]) -> Tuple[float, float, float]:
+        return min(samples), median(samples), max(samples)
+
+
+def measure(fn: Callable[[], Any], repeat=1) -> Tuple[Any, Timing]:
+    timing = Timing()
+    result = None
+    for _ in range(repeat):
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        result = fn()
+        wall1, cpu1 = time.perf_counter(), time.process_time()
+        timing.wall.append(wall1 - wall0)
+        timing.cpu.append(cpu1 - cpu0)
+    return result, timing
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_timing(timing: Timing) -> List[str]:
+    lines = []
+    for name, samples in (("wall", timing.wall), ("cpu", timing.cpu)):
+        lo, mid, hi = timing.summary(samples)
+        lines.append(
+            f"{name:<4} min {format_seconds(lo):>9}  "
+            f"median {format_seconds(mid):>9}  "
+            f"max {format_seconds(hi):>9}"
+        )
+    return lines